@@ -0,0 +1,110 @@
+# autopilot.py - A simple reference pilot for automated testing
+# Flies like a careful player: get over the pad, then come down slowly
+
+import math
+from collections import deque
+from constants import (
+    ROTATION_SPEED, MAX_LANDING_VELOCITY, SHIP_SIZE, LANDING_PAD_Y,
+    GRAVITY, THRUST_POWER
+)
+from controls import Controller, IDLE
+
+# Tuning for the reference pilot (not the game - see constants.py for that)
+AUTOPILOT_MAX_TILT = 35.0           # Degrees the pilot will lean to move sideways
+AUTOPILOT_CRUISE_SPEED = 3.0        # Fastest sideways speed while traveling to the pad
+AUTOPILOT_TERRAIN_CLEARANCE = 60    # Pixels to stay above hills while traveling
+AUTOPILOT_APPROACH_ALTITUDE = 40    # Don't go lower than this until over the pad
+                                    # (low enough that the hills decide the route)
+AUTOPILOT_BRAKING = 0.5             # Fraction of full braking power to plan with
+AUTOPILOT_TOUCHDOWN_SPEED = MAX_LANDING_VELOCITY * 0.5
+
+# Human-like mistakes, for a pilot given an rng (see Autopilot)
+AUTOPILOT_MAX_REACTION_STEPS = 3    # Most physics steps a pilot's reactions lag behind
+AUTOPILOT_CONTROL_NOISE = 0.03      # Chance per step of getting each control wrong
+
+
+class Autopilot(Controller):
+    """
+    Reference pilot that can be used anywhere a controller is expected.
+    It only looks at what a player could see: the ship, the pad, and the terrain.
+
+    Without an rng it flies perfectly, the same way every time. Given one,
+    it flies like a person: it reacts a few steps late, and now and then
+    holds a control it shouldn't (or lets go of one it should hold).
+    """
+
+    def __init__(self, rng=None):
+        """
+        Initialize the pilot.
+
+        Args:
+            rng: random.Random for the pilot's mistakes, or None for none
+        """
+        self.rng = rng
+
+        # Decisions waiting out the reaction delay, oldest first
+        delay = rng.randint(0, AUTOPILOT_MAX_REACTION_STEPS) if rng else 0
+        self._reactions = deque([IDLE] * delay)
+
+    def decide(self, ship, level, package):
+        """
+        Decide which controls to hold this step.
+
+        Args:
+            ship: The Ship being flown
+            level: The current Level
+            package: The Package on board (the pilot flies every package the same)
+
+        Returns:
+            Tuple of (rotate_left, rotate_right, thrust) booleans
+        """
+        pad = level.pad_info
+
+        # Sideways: head for the pad center, slowing down as we get close
+        offset = pad.center_x - ship.x
+        target_vel_x = max(-AUTOPILOT_CRUISE_SPEED,
+                           min(AUTOPILOT_CRUISE_SPEED, offset * 0.02))
+
+        # Lean into the thrust direction needed to fix sideways speed
+        target_angle = (target_vel_x - ship.vel_x) * 15.0
+        target_angle = max(-AUTOPILOT_MAX_TILT, min(AUTOPILOT_MAX_TILT, target_angle))
+
+        # Down: never fall faster than we could brake in the altitude left
+        # (stopping distance = speed^2 / (2 * deceleration))
+        altitude = max(0, LANDING_PAD_Y - ship.y)
+        braking = (THRUST_POWER - GRAVITY) * AUTOPILOT_BRAKING
+        target_vel_y = AUTOPILOT_TOUCHDOWN_SPEED + math.sqrt(2 * braking * altitude)
+
+        # Not over the pad yet? Stay high, and above the hills in the way
+        over_pad = abs(offset) < pad.width / 2 - SHIP_SIZE / 2
+        if not over_pad:
+            left = min(ship.x, pad.center_x)
+            right = max(ship.x, pad.center_x)
+            highest = min(level.get_terrain_height(x)
+                          for x in range(int(left), int(right) + 1, 10))
+            floor_y = min(highest - AUTOPILOT_TERRAIN_CLEARANCE,
+                          LANDING_PAD_Y - AUTOPILOT_APPROACH_ALTITUDE)
+            if ship.y > floor_y:
+                target_vel_y = -0.5  # Climb
+            else:
+                # Brake in time to level off at the floor
+                room = floor_y - ship.y
+                target_vel_y = min(target_vel_y, math.sqrt(2 * braking * room))
+
+        # Rotate toward the target angle
+        rotate_left = ship.angle > target_angle + ROTATION_SPEED / 2
+        rotate_right = ship.angle < target_angle - ROTATION_SPEED / 2
+
+        # Thrust when falling too fast, or when leaning to change sideways
+        # speed (as long as that doesn't send us back up)
+        falling_too_fast = ship.vel_y > target_vel_y
+        needs_sideways = abs(target_vel_x - ship.vel_x) > 0.3 and abs(ship.angle) > 10
+        thrust = falling_too_fast or (needs_sideways and ship.vel_y > -0.5)
+
+        if self.rng is None:
+            return rotate_left, rotate_right, thrust
+
+        # A late reaction, with the odd slip of the hand
+        self._reactions.append((rotate_left, rotate_right, thrust))
+        return tuple(held != (self.rng.random() < AUTOPILOT_CONTROL_NOISE)
+                     for held in self._reactions.popleft())
@@ -0,0 +1,111 @@
+# batch_physics.py - Vectorized physics for stepping many ships at once
+# Same math as physics.py, but every argument is a NumPy array (one entry per ship)
+
+import numpy as np
+from constants import GRAVITY, THRUST_POWER, FUEL_BURN_RATE
+
+
+def apply_gravity_batch(vel_x, vel_y, dt=1.0):
+    """
+    Apply gravitational acceleration to every ship's velocity.
+
+    Args:
+        vel_x, vel_y: Arrays of current velocities
+        dt: Delta time multiplier (default 1.0 for frame-based)
+
+    Returns:
+        Tuple of (new_vel_x, new_vel_y) arrays
+    """
+    return vel_x, vel_y + GRAVITY * dt
+
+
+def apply_thrust_batch(vel_x, vel_y, angle_degrees, thrusting,
+                       thrust_power=THRUST_POWER, dt=1.0):
+    """
+    Apply thrust to the ships that are thrusting.
+    Ship angle 0 = pointing up, positive = clockwise rotation.
+
+    Args:
+        vel_x, vel_y: Arrays of current velocities
+        angle_degrees: Array of ship angles in degrees (0 = up)
+        thrusting: Boolean array, True where the ship is firing its thruster
+        thrust_power: Force of thrust
+        dt: Delta time multiplier
+
+    Returns:
+        Tuple of (new_vel_x, new_vel_y, delta_v) arrays, where delta_v is
+        the acceleration magnitude applied to each ship (0 if not thrusting)
+    """
+    angle_rad = np.radians(angle_degrees - 90)
+
+    # Ships that are not thrusting get zero acceleration
+    power = np.where(thrusting, thrust_power * dt, 0.0)
+    thrust_x = np.cos(angle_rad) * power
+    thrust_y = np.sin(angle_rad) * power
+
+    delta_v = np.sqrt(thrust_x**2 + thrust_y**2)
+
+    return vel_x + thrust_x, vel_y + thrust_y, delta_v
+
+
+def update_position_batch(x, y, vel_x, vel_y, dt=1.0):
+    """
+    Update every ship's position based on its velocity.
+
+    Args:
+        x, y: Arrays of current positions
+        vel_x, vel_y: Arrays of current velocities
+        dt: Delta time multiplier
+
+    Returns:
+        Tuple of (new_x, new_y) arrays
+    """
+    return x + vel_x * dt, y + vel_y * dt
+
+
+def step_batch(x, y, vel_x, vel_y, angle, fuel, thrusting, dt=1.0):
+    """
+    Advance N ships by one physics step.
+    Follows the same order as GameState.update: gravity, thrust, fuel burn, position.
+
+    Args:
+        x, y: Arrays of positions
+        vel_x, vel_y: Arrays of velocities
+        angle: Array of ship angles in degrees
+        fuel: Array of remaining fuel
+        thrusting: Boolean array of thruster input (ignored where fuel is empty)
+        dt: Delta time multiplier
+
+    Returns:
+        Dictionary of new state arrays:
+        - 'x', 'y', 'vel_x', 'vel_y', 'angle', 'fuel', 'thrusting'
+        - 'delta_v': Per-ship acceleration magnitude, for Package.add_delta_v
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    vel_x = np.asarray(vel_x, dtype=float)
+    vel_y = np.asarray(vel_y, dtype=float)
+    angle = np.asarray(angle, dtype=float)
+    fuel = np.asarray(fuel, dtype=float)
+
+    # Same rule as Ship.can_thrust - no fuel, no thrust
+    thrusting = np.asarray(thrusting, dtype=bool) & (fuel > 0)
+
+    vel_x, vel_y = apply_gravity_batch(vel_x, vel_y, dt)
+    vel_x, vel_y, delta_v = apply_thrust_batch(vel_x, vel_y, angle, thrusting, dt=dt)
+
+    # Same rule as Ship.consume_fuel - burn while thrusting, never below zero
+    fuel = np.where(thrusting, np.maximum(0.0, fuel - FUEL_BURN_RATE * dt), fuel)
+
+    x, y = update_position_batch(x, y, vel_x, vel_y, dt)
+
+    return {
+        'x': x,
+        'y': y,
+        'vel_x': vel_x,
+        'vel_y': vel_y,
+        'angle': angle,
+        'fuel': fuel,
+        'thrusting': thrusting,
+        'delta_v': delta_v
+    }
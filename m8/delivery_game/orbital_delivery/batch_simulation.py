@@ -0,0 +1,149 @@
+# batch_simulation.py - Many headless deliveries flown side by side in lockstep
+# Each controller still decides in Python, but the physics for the whole
+# batch is one set of NumPy operations per step instead of one GameState.update each
+
+import numpy as np
+from constants import (
+    PHYSICS_TIMESTEP, PHYSICS_TUNING_HZ, ROTATION_SPEED,
+    MAX_LANDING_VELOCITY, LANDING_PAD_Y, FALLING_FAST_VELOCITY,
+    STATE_DESCENT, STATE_RATING, STATE_GAME_OVER
+)
+from batch_physics import step_batch
+from game_state import GameState
+from simulation import MAX_SIMULATION_FRAMES, delivery_result
+
+
+def simulate_batch(controllers, difficulty=1, max_frames=MAX_SIMULATION_FRAMES,
+                   seeds=None):
+    """
+    Fly one delivery per controller, all advanced one physics step at a time.
+    Gives the same outcomes as calling simulate_delivery for each controller
+    with the matching seed.
+
+    Args:
+        controllers: Sequence of controls.Controller, one per delivery.
+                     Use separate instances if a controller keeps state.
+        difficulty: Level difficulty (1+) for every delivery
+        max_frames: Stop after this many frames even if still flying
+        seeds: Optional sequence of seeds, one per controller (see GameState)
+
+    Returns:
+        List of outcome dictionaries (see simulate_delivery), one per controller
+    """
+    # Set up each delivery exactly like simulate_delivery does
+    games = []
+    seeds = seeds if seeds is not None else [None] * len(controllers)
+    for controller, seed in zip(controllers, seeds):
+        game = GameState(controller=controller, seed=seed)
+        game.difficulty = difficulty
+        game.new_delivery()
+        game.state = STATE_DESCENT
+        games.append(game)
+
+    ships = [game.ship for game in games]
+    count = len(games)
+    frames = [0] * count
+
+    # Ship state for the whole batch, one array entry per delivery
+    x = np.array([ship.x for ship in ships], dtype=float)
+    y = np.array([ship.y for ship in ships], dtype=float)
+    vel_x = np.array([ship.vel_x for ship in ships], dtype=float)
+    vel_y = np.array([ship.vel_y for ship in ships], dtype=float)
+    angle = np.array([ship.angle for ship in ships], dtype=float)
+    fuel = np.array([ship.fuel for ship in ships], dtype=float)
+    delivery_time = np.zeros(count)
+    total_delta_v = np.zeros(count)
+
+    # Landing pads, world widths, and the highest each level's terrain can
+    # reach: a ship that stayed above that can't have touched the ground
+    pads = [game.level.pad_info for game in games]
+    pad_x = np.array([pad.x for pad in pads], dtype=float)
+    pad_right = pad_x + np.array([pad.width for pad in pads], dtype=float)
+    pad_y = np.array([pad.y for pad in pads], dtype=float)
+    world_right = np.array([game.level.width - 20 for game in games], dtype=float)
+    terrain_top = np.array([game.level.terrain.top for game in games])
+
+    dt = PHYSICS_TIMESTEP * PHYSICS_TUNING_HZ
+    flying = np.ones(count, dtype=bool)
+
+    for _ in range(max_frames):
+        live = np.flatnonzero(flying)
+        if len(live) == 0:
+            break
+
+        # Controls - the only per-delivery Python work on most steps
+        rotate_left = np.zeros(count, dtype=bool)
+        rotate_right = np.zeros(count, dtype=bool)
+        thrust = np.zeros(count, dtype=bool)
+        for n in live.tolist():
+            game = games[n]
+            rotate_left[n], rotate_right[n], thrust[n] = \
+                game.controller.decide(game.ship, game.level, game.package)
+
+        prev_x = x.copy()
+        prev_y = y.copy()
+
+        # Same order as GameState.update: rotate, then gravity/thrust/fuel/position
+        angle = np.where(flying & rotate_left, angle - ROTATION_SPEED * dt, angle)
+        angle = np.where(flying & rotate_right, angle + ROTATION_SPEED * dt, angle)
+
+        state = step_batch(x, y, vel_x, vel_y, angle, fuel, flying & thrust, dt)
+        thrusting = state['thrusting']
+        x = np.where(flying, np.clip(state['x'], 20, world_right), x)
+        y = np.where(flying, state['y'], y)
+        vel_x = np.where(flying, state['vel_x'], vel_x)
+        vel_y = np.where(flying, state['vel_y'], vel_y)
+        fuel = state['fuel']
+        total_delta_v = total_delta_v + state['delta_v']
+        delivery_time = np.where(flying, delivery_time + PHYSICS_TIMESTEP, delivery_time)
+
+        # Terrain: only sweep the deliveries that got low enough to touch it
+        crashed = np.zeros(count, dtype=bool)
+        low = flying & (np.maximum(prev_y, y) >= terrain_top)
+        for n in np.flatnonzero(low).tolist():
+            hit_time = games[n].level.sweep_terrain(prev_x[n], prev_y[n], x[n], y[n])
+            if hit_time is not None:
+                # Stop the ship where it touched the ground
+                x[n] = prev_x[n] + (x[n] - prev_x[n]) * hit_time
+                y[n] = prev_y[n] + (y[n] - prev_y[n]) * hit_time
+                crashed[n] = True
+
+        # Landing pad (same rules as physics.check_landing)
+        reached = flying & ~crashed & (y >= pad_y)
+        on_pad = (pad_x <= x) & (x <= pad_right)
+        velocity_ok = np.sqrt(vel_x**2 + vel_y**2) <= MAX_LANDING_VELOCITY
+        landed = reached & on_pad & velocity_ok
+        crashed |= reached & ~landed
+
+        # Out of fuel while still high up and falling fast
+        stranded = (flying & ~crashed & ~landed & (fuel <= 0)
+                    & (y < LANDING_PAD_Y - 100) & (vel_y > FALLING_FAST_VELOCITY))
+
+        # Copy the new state back so controllers (and the results) see it
+        for n, ship_x, ship_y, ship_vel_x, ship_vel_y, ship_angle, ship_fuel, thrust_on, \
+                time_so_far, delta_v_so_far in zip(
+                    live.tolist(), x[live].tolist(), y[live].tolist(),
+                    vel_x[live].tolist(), vel_y[live].tolist(), angle[live].tolist(),
+                    fuel[live].tolist(), thrusting[live].tolist(),
+                    delivery_time[live].tolist(), total_delta_v[live].tolist()):
+            ship = ships[n]
+            ship.prev_x, ship.prev_y, ship.prev_angle = ship.x, ship.y, ship.angle
+            ship.x, ship.y = ship_x, ship_y
+            ship.vel_x, ship.vel_y = ship_vel_x, ship_vel_y
+            ship.angle, ship.fuel, ship.thrusting = ship_angle, ship_fuel, thrust_on
+            package = games[n].package
+            package.delivery_time = time_so_far
+            package.total_delta_v = delta_v_so_far
+            frames[n] += 1
+
+        for n in np.flatnonzero(crashed | landed).tolist():
+            games[n].landed_successfully = bool(landed[n])
+            if crashed[n]:
+                games[n].package.mark_crashed()
+            games[n].state = STATE_RATING
+        for n in np.flatnonzero(stranded).tolist():
+            games[n].state = STATE_GAME_OVER
+
+        flying &= ~(crashed | landed | stranded)
+
+    return [delivery_result(game, frames[n]) for n, game in enumerate(games)]
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks - times the hot spots of the game logic and compares them
+with a saved baseline, so a slowdown gets noticed before players do.
+
+Every benchmark uses fixed seeds, so each run does exactly the same work.
+Timings are the best of several repeats (the least disturbed by whatever
+else the computer was doing).
+
+Code that runs on every physics step should also allocate nothing, so
+garbage doesn't pile up while the game runs. Benchmarks listed in
+ALLOCATION_FREE are checked for that with tracemalloc.
+
+Usage:
+    python benchmarks.py --save          # Record a baseline on this computer
+    python benchmarks.py                 # Compare against it
+    python benchmarks.py --filter Terrain --threshold 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from itertools import repeat
+
+from constants import SCREEN_WIDTH, LANDING_PAD_Y, STATE_DESCENT
+from physics import apply_thrust, update_position, check_landing, check_terrain_collision
+from level import Terrain
+from ship import Ship
+from package import Package
+from game_state import GameState
+
+DEFAULT_BASELINE = "benchmarks_baseline.json"
+DEFAULT_THRESHOLD = 10.0   # Percent slower than baseline that counts as a regression
+TERRAIN_RESOLUTIONS = [50, 200, 1000]
+FLAT_ZONE = (300, 460)     # Where the pad would be (terrain is flat there)
+
+# X positions for terrain lookups, spread across the whole screen
+LOOKUP_XS = [SCREEN_WIDTH * (i + 0.5) / 10 for i in range(10)]
+
+# Benchmarks whose code must not leave anything allocated behind, and the
+# most bytes one call may have in use at once. That leaves room for loop
+# iterators and a few ints (CPython makes a new object for every int above
+# 256, like terrain segment numbers), but not for building lists of
+# terrain points like the step used to.
+ALLOCATION_FREE = ["GameState._step"]
+ALLOCATION_LIMIT = 256
+
+# name -> function that sets up the benchmark and returns the code to time
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Decorator that registers a benchmark setup function under a name."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# =============================================================================
+# PHYSICS
+# =============================================================================
+
+@benchmark("physics.apply_thrust")
+def bench_apply_thrust():
+    return lambda: apply_thrust(0.5, 1.2, 30.0)
+
+
+@benchmark("physics.update_position")
+def bench_update_position():
+    return lambda: update_position(400.0, 300.0, 0.5, 1.2)
+
+
+@benchmark("physics.check_landing")
+def bench_check_landing():
+    return lambda: check_landing(350.0, LANDING_PAD_Y + 1, 0.3, 1.5,
+                                 300, LANDING_PAD_Y, 100, 10)
+
+
+@benchmark("physics.check_terrain_collision")
+def bench_check_terrain_collision():
+    terrain = Terrain(difficulty=5, flat_zone=FLAT_ZONE, rng=random.Random(0))
+    return lambda: check_terrain_collision(200.0, 400.0, terrain.get_height_at)
+
+
+# =============================================================================
+# GAME STATE
+# =============================================================================
+
+@benchmark("GameState._step")
+def bench_game_step():
+    game = GameState(seed=0)
+    game.difficulty = 5
+    game.new_delivery()
+    game.state = STATE_DESCENT
+    ship = game.ship
+    pad = game.level.pad_info
+    start_x = float(pad.center_x)
+    start_y = float(pad.y - 5)
+
+    def run():
+        # Thrusting just above the pad: every check runs, and none ends the delivery
+        ship.x = start_x
+        ship.y = start_y
+        ship.vel_x = 0.2
+        ship.vel_y = 0.5
+        ship.fuel = 100
+        ship.thrusting = True
+        game._step()
+    return run
+
+
+@benchmark("Game headless, 300 steps")
+def bench_headless_game():
+    # Imported here so the other benchmarks run without pygame
+    from main import Game
+    game = Game(headless=True, seed=0)
+
+    def run():
+        # The game loop's steps with no window or keyboard (the ship just
+        # falls, so crashes start new deliveries along the way)
+        game.difficulty = 5
+        game.new_delivery(seed=0)
+        game.state = STATE_DESCENT
+        for _ in range(300):
+            if game.state != STATE_DESCENT:
+                game.new_delivery()
+                game.state = STATE_DESCENT
+            game.handle_input()
+            game.update()
+    return run
+
+
+@benchmark("Ship+Package snapshot and restore")
+def bench_snapshot_restore():
+    ship = Ship(400, 300, rng=random.Random(0))
+    package = make_package("fragile")
+
+    def run():
+        # What a search or rewind does to copy the state and go back to it
+        ship.restore(ship.snapshot())
+        package.restore(package.snapshot())
+    return run
+
+
+# =============================================================================
+# TERRAIN
+# =============================================================================
+
+def bench_generate_chunk(resolution):
+    terrain = Terrain(difficulty=8, flat_zone=FLAT_ZONE, resolution=resolution,
+                      rng=random.Random(0))
+    return lambda: terrain.generate_chunk(0)  # Includes the pad's flat zone
+
+
+def bench_get_height_at(resolution):
+    terrain = Terrain(difficulty=8, flat_zone=FLAT_ZONE, resolution=resolution,
+                      rng=random.Random(0))
+
+    def run():
+        for x in LOOKUP_XS:
+            terrain.get_height_at(x)
+    run()  # Generate the chunks first - time the lookups alone
+    return run
+
+
+for _resolution in TERRAIN_RESOLUTIONS:
+    benchmark(f"Terrain.generate_chunk[res={_resolution}]")(
+        lambda resolution=_resolution: bench_generate_chunk(resolution))
+    benchmark(f"Terrain.get_height_at[res={_resolution}] x{len(LOOKUP_XS)}")(
+        lambda resolution=_resolution: bench_get_height_at(resolution))
+
+
+# =============================================================================
+# SHIP GEOMETRY
+# =============================================================================
+
+@benchmark("Ship.get_triangle_points")
+def bench_triangle_points():
+    ship = Ship(400, 300, rng=random.Random(0))
+    ship.angle = 27.0
+    return ship.get_triangle_points
+
+
+@benchmark("Ship.get_flame_points")
+def bench_flame_points():
+    ship = Ship(400, 300, rng=random.Random(0))
+    ship.angle = 27.0
+    return ship.get_flame_points
+
+
+# =============================================================================
+# RATING
+# =============================================================================
+
+def make_package(package_type):
+    """A package partway through a typical delivery."""
+    package = Package(package_type, rng=random.Random(0))
+    package.total_delta_v = 9.5
+    package.delivery_time = 11.0
+    return package
+
+
+@benchmark("Package.calculate_rating")
+def bench_calculate_rating():
+    fragile = make_package("fragile")
+    urgent = make_package("urgent")
+
+    def run():
+        fragile.calculate_rating()
+        urgent.calculate_rating()
+    return run
+
+
+@benchmark("Package.generate_review")
+def bench_generate_review():
+    fragile = make_package("fragile")
+    urgent = make_package("urgent")
+
+    def run():
+        # Reviews are cached after the first one - time writing a fresh one
+        fragile._cached_review = None
+        urgent._cached_review = None
+        fragile.generate_review()
+        urgent.generate_review()
+    return run
+
+
+# =============================================================================
+# RUNNING AND REPORTING
+# =============================================================================
+
+def time_benchmark(setup, repeat=5):
+    """
+    Time one benchmark.
+
+    Args:
+        setup: Registered setup function
+        repeat: How many timing rounds to take the best of
+
+    Returns:
+        Seconds per call
+    """
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()  # Enough calls for a round to take ~0.2s
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_allocations(run, calls=1000):
+    """
+    Measure the memory a benchmark's code allocates, with tracemalloc.
+    (tracemalloc's own bookkeeping is measured alongside and left out.)
+
+    Args:
+        run: Code to measure (what a benchmark's setup returns)
+        calls: How many calls to measure over
+
+    Returns:
+        Tuple of (most bytes one call had in use at once, bytes still in
+        use after all the calls)
+    """
+    def measure(code):
+        code()  # Warm up (caches, first-call setup)
+        tracemalloc.start()
+        peak = 0
+        for _ in repeat(None, calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            code()
+            _, during = tracemalloc.get_traced_memory()
+            peak = max(peak, during - before)
+
+        # What's left behind is measured in a second round, so the
+        # bookkeeping above (like peak, once it's a large int) isn't counted
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in repeat(None, calls):
+            code()
+        end, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak, end - start
+
+    overhead_peak, overhead_kept = measure(lambda: None)
+    peak, kept = measure(run)
+    return max(0, peak - overhead_peak), max(0, kept - overhead_kept)
+
+
+def format_time(seconds):
+    """Format a duration with a readable unit."""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.0f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    return f"{seconds * 1e3:.2f} ms"
+
+
+def load_baseline(path):
+    """Load saved results, or None if there's no baseline yet."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    """Save results (plus where they were measured) as the new baseline."""
+    with open(path, "w") as f:
+        json.dump({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'results': results
+        }, f, indent=2)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the game logic")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline results file to compare with")
+    parser.add_argument("--save", action="store_true",
+                        help="save these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="percent slowdown to report as a regression")
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timing rounds per benchmark (best one counts)")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    baseline_results = baseline['results'] if baseline else {}
+
+    results = {}
+    regressions = []
+    print(f"{'Benchmark':<42} {'Time':>10} {'Baseline':>10} {'Change':>8}")
+
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        seconds = time_benchmark(setup, args.repeat)
+        results[name] = seconds
+
+        line = f"{name:<42} {format_time(seconds):>10}"
+        if name in baseline_results:
+            old = baseline_results[name]
+            change = (seconds - old) / old * 100
+            line += f" {format_time(old):>10} {change:>+7.1f}%"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    # Per-step code must not leave garbage behind (checked with or without a baseline)
+    allocating = []
+    checked = [name for name in ALLOCATION_FREE if args.filter in name]
+    if checked:
+        print("\nAllocations per call")
+    for name in checked:
+        peak, kept = measure_allocations(BENCHMARKS[name]())
+        line = f"{name:<42} {peak:>7} B in use at most, {kept} B kept"
+        if peak > ALLOCATION_LIMIT or kept:
+            allocating.append(name)
+            line += "  ALLOCATES"
+        print(line)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline} yet - run with --save to make one")
+    elif regressions:
+        print(f"\n{len(regressions)} benchmark(s) more than {args.threshold:g}% slower "
+              f"than the baseline")
+
+    if allocating:
+        print(f"\n{len(allocating)} benchmark(s) allocate: more than {ALLOCATION_LIMIT} B "
+              f"in use at once, or memory kept after the calls")
+    if allocating or (regressions and not args.save):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Difficulty calibration - flies thousands of generated levels per difficulty
+with the reference autopilot and reports how hard each difficulty really is.
+
+Each run's seed picks the level, nudges where the ship starts, and drives
+the pilot's mistakes (see autopilot.Autopilot), so no two runs fly alike.
+A difficulty whose runs all came out the same measured nothing, and the
+report fails.
+
+Runs are spread across every CPU core with a process pool, and the raw
+results are saved as NumPy columns so they can be re-analyzed later.
+
+Usage:
+    python calibrate.py                              # 1000 runs each, levels 1-10
+    python calibrate.py --runs 5000 --max-difficulty 15 --out results.npz
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+from constants import STATE_GAME_OVER
+from simulation import simulate_delivery
+from autopilot import Autopilot
+
+PACKAGE_TYPES = ["fragile", "urgent"]  # Stored as indexes in the results file
+
+# Run seeds are (base seed, difficulty, run number) packed into one number,
+# so no two runs share a seed, whatever the difficulty, --seed or --runs
+SEED_STRIDE = 2 ** 20     # Room for this many runs per difficulty
+
+# How far each run's start is nudged from the level's usual one
+START_JITTER_X = 40       # Pixels either way
+START_JITTER_VEL = 0.5    # Velocity either way, in each direction
+
+# Results that must vary between runs of a difficulty for it to tell us anything
+VARYING_COLUMNS = ["frames", "fuel", "total_delta_v"]
+
+# Column names and compact storage types for the results file
+COLUMNS = [
+    ("difficulty", np.uint8),
+    ("seed", np.uint64),
+    ("landed", np.bool_),
+    ("game_over", np.bool_),
+    ("rating", np.uint8),
+    ("fuel", np.float32),
+    ("delivery_time", np.float32),
+    ("total_delta_v", np.float32),
+    ("frames", np.uint32),
+    ("package_type", np.uint8),
+]
+
+
+def run_one(job):
+    """
+    Fly one level (runs inside a worker process).
+
+    Args:
+        job: (difficulty, seed) tuple
+
+    Returns:
+        Tuple of result columns, in the order of COLUMNS
+    """
+    difficulty, seed = job
+    # Same seed -> same level, package, start and mistakes, so the same flight.
+    # The pilot gets its own stream, apart from the one the level comes from.
+    rng = random.Random(f"pilot-{seed}")
+    jitter = (rng.uniform(-START_JITTER_X, START_JITTER_X),
+              rng.uniform(-START_JITTER_VEL, START_JITTER_VEL),
+              rng.uniform(-START_JITTER_VEL, START_JITTER_VEL))
+
+    def nudge_start(game):
+        offset_x, game.ship.vel_x, game.ship.vel_y = jitter
+        game.ship.x = max(20, min(game.level.width - 20, game.ship.x + offset_x))
+        game.ship.save_previous()
+
+    result = simulate_delivery(difficulty, controller=Autopilot(rng), seed=seed,
+                               setup=nudge_start)
+    return (
+        difficulty,
+        seed,
+        result['landed'],
+        result['state'] == STATE_GAME_OVER,
+        result['rating'],
+        result['fuel'],
+        result['delivery_time'],
+        result['total_delta_v'],
+        result['frames'],
+        PACKAGE_TYPES.index(result['package_type'])
+    )
+
+
+def run_seed(base_seed, difficulty, run):
+    """Seed for one run, different for every (base seed, difficulty, run)."""
+    return (base_seed * SEED_STRIDE + difficulty) * SEED_STRIDE + run
+
+
+def calibrate(difficulties, runs, processes=None, base_seed=0):
+    """
+    Fly `runs` levels at each difficulty, spread over a process pool.
+
+    Args:
+        difficulties: Iterable of difficulty levels to test
+        runs: Number of levels to fly per difficulty
+        processes: Worker count (defaults to every CPU core)
+        base_seed: Non-negative seed for the whole sample; each value
+                   flies different levels from every other
+
+    Returns:
+        Dictionary mapping column name to NumPy array (one entry per run)
+    """
+    processes = processes or os.cpu_count()
+    jobs = [(difficulty, run_seed(base_seed, difficulty, i))
+            for difficulty in difficulties for i in range(runs)]
+
+    # Hand out work in chunks so workers aren't waiting on the pool
+    chunksize = max(1, len(jobs) // (processes * 16))
+    with Pool(processes) as pool:
+        rows = pool.map(run_one, jobs, chunksize=chunksize)
+
+    columns = list(zip(*rows))
+    return {name: np.array(values, dtype=dtype)
+            for (name, dtype), values in zip(COLUMNS, columns)}
+
+
+def find_unvarying(results):
+    """
+    Find difficulties whose runs all came out exactly the same, which
+    means the runs measured nothing about the levels.
+
+    Returns:
+        List of (difficulty, column names that never changed)
+    """
+    unvarying = []
+    for difficulty in np.unique(results['difficulty']):
+        rows = results['difficulty'] == difficulty
+        if rows.sum() < 2:
+            continue
+        same = [name for name in VARYING_COLUMNS
+                if len(np.unique(results[name][rows])) == 1]
+        if same:
+            unvarying.append((int(difficulty), same))
+    return unvarying
+
+
+def print_report(results):
+    """Print a per-difficulty summary table."""
+    print(f"{'Level':>5} {'Runs':>6} {'Landed':>7} {'Fuel left':>10} "
+          f"{'Time':>6}   " + "  ".join(f"{stars}*".rjust(5) for stars in range(1, 6)))
+
+    for difficulty in np.unique(results['difficulty']):
+        rows = results['difficulty'] == difficulty
+        landed = results['landed'][rows]
+
+        # Fuel and time only mean something for deliveries that made it
+        fuel = results['fuel'][rows][landed]
+        delivery_time = results['delivery_time'][rows][landed]
+        fuel_text = f"{fuel.mean():.1f}" if len(fuel) else "-"
+        time_text = f"{delivery_time.mean():.1f}s" if len(delivery_time) else "-"
+
+        # Share of runs at each star rating
+        star_counts = np.bincount(results['rating'][rows], minlength=6)[1:]
+        star_text = "  ".join(f"{count / rows.sum():5.0%}" for count in star_counts)
+
+        print(f"{difficulty:>5} {rows.sum():>6} {landed.mean():>7.1%} {fuel_text:>10} "
+              f"{time_text:>6}   {star_text}")
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Calibrate difficulty with the reference autopilot")
+    parser.add_argument("--runs", type=int, default=1000,
+                        help="levels to fly per difficulty")
+    parser.add_argument("--min-difficulty", type=int, default=1)
+    parser.add_argument("--max-difficulty", type=int, default=10)
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="base seed for the runs")
+    parser.add_argument("--out", default="calibration.npz",
+                        help="results file (NumPy .npz columns)")
+    args = parser.parse_args()
+    if not 0 < args.runs <= SEED_STRIDE:
+        parser.error(f"--runs must be between 1 and {SEED_STRIDE}")
+    if args.seed < 0:
+        parser.error("--seed must be 0 or more")
+
+    difficulties = range(args.min_difficulty, args.max_difficulty + 1)
+
+    start = time.perf_counter()
+    results = calibrate(difficulties, args.runs, args.processes, args.seed)
+    elapsed = time.perf_counter() - start
+
+    np.savez_compressed(args.out, **results)
+
+    print_report(results)
+    print(f"\n{len(results['seed'])} runs in {elapsed:.1f}s, saved to {args.out}")
+
+    unvarying = find_unvarying(results)
+    for difficulty, names in unvarying:
+        print(f"NO VARIANCE: every level {difficulty} run had the same {', '.join(names)}")
+    if unvarying:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+TEXT_CACHE_SIZE = 256       # Rendered text surfaces kept for reuse
+DIRTY_RECT_RENDERING = True # During descent, only redraw the parts of the screen that change
+CAMERA_DEADZONE = 150       # How far the ship can be from screen center before the view scrolls
 
 # Colors
 BLACK = (0, 0, 0)
@@ -19,6 +22,17 @@ BLUE = (100, 149, 237)
 GRAY = (128, 128, 128)
 DARK_GRAY = (64, 64, 64)
 
+# =============================================================================
+# TIMING
+# =============================================================================
+PHYSICS_HZ = 60             # Fixed physics steps per second (separate from FPS)
+PHYSICS_TIMESTEP = 1.0 / PHYSICS_HZ
+PHYSICS_TUNING_HZ = 60      # Step rate the per-frame values below were tuned at
+MAX_FRAME_TIME = 0.25       # Longest frame (seconds) the physics will catch up on
+PROFILER_HISTORY = 600      # Frames of timings the profiler keeps (F3 to show)
+PROFILER_TRACE_FILE = "frame_trace.json"  # Where F4 saves the profiler trace
+FIRST_FRAME_BUDGET = 1.0    # Most seconds from launch to the title screen (see startup.py)
+
 # =============================================================================
 # PHYSICS
 # =============================================================================
@@ -40,6 +54,8 @@ FUEL_BURN_RATE = 0.3        # Fuel consumed per frame while thrusting
 SHIP_START_X = 400
 SHIP_START_Y = 80
 SHIP_SIZE = 20              # Ship triangle size
+SHIP_SPRITE_SUPERSAMPLE = 4 # Sprites are drawn this many times larger, then shrunk (smooth edges)
+SHIP_FLAME_VARIANTS = 3     # Pre-drawn flame lengths per angle (for the flicker)
 
 # =============================================================================
 # LANDING ZONE
@@ -56,6 +72,9 @@ TERRAIN_HEIGHT_PER_LEVEL = 10    # Additional height variation per level
 MAX_TERRAIN_HEIGHT = 80          # Cap on terrain roughness
 TERRAIN_FLAT_ZONE_MARGIN = 30    # Extra flat space on each side of landing pad
 TERRAIN_TRANSITION_WIDTH = 40    # Pixels to smooth terrain into flat zones
+TERRAIN_RESOLUTION = 50          # Terrain segments across the screen
+TERRAIN_CHUNK_WIDTH = 400        # Terrain is generated this many pixels at a time, as needed
+TERRAIN_CHUNK_CACHE_SIZE = 8     # Generated chunks kept (least recently used are dropped)
 
 # Terrain wave parameters (for procedural generation)
 TERRAIN_WAVE_PRIMARY_FREQ = 0.01     # Large hills frequency
@@ -65,12 +84,17 @@ TERRAIN_WAVE_SECONDARY_AMP = 0.3     # Medium features amplitude multiplier
 TERRAIN_WAVE_TERTIARY_FREQ = 0.05    # Small bumps frequency
 TERRAIN_WAVE_TERTIARY_AMP = 0.1      # Small bumps amplitude multiplier
 
+# =============================================================================
+# WORLD
+# =============================================================================
+WORLD_WIDTH = SCREEN_WIDTH * 8   # Levels are this wide; the view follows the ship
+
 # =============================================================================
 # SHIP STARTING POSITION (Lateral Offset)
 # =============================================================================
 LATERAL_OFFSET_PER_LEVEL = 60    # Pixels offset per difficulty level
 MAX_LATERAL_OFFSET = 300         # Maximum starting offset from pad
-SHIP_SCREEN_MARGIN = 50          # Margin from screen edge for ship positioning
+SHIP_SCREEN_MARGIN = 50          # Margin from world edge for ship positioning
 
 # =============================================================================
 # FRAGILE PACKAGE - Rating thresholds (total delta-v experienced)
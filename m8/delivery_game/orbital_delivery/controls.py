@@ -0,0 +1,73 @@
+# controls.py - Controllers that drive the ship
+# Each controller answers one question per physics step: which controls are held?
+
+# No controls held (coast)
+IDLE = (False, False, False)
+
+
+class Controller:
+    """
+    Base class for anything that flies the ship: the keyboard, a script,
+    or an autopilot.
+
+    Subclasses implement decide(), which only sees what a player could see.
+    The same controller can then drive the windowed game, a headless
+    simulation, or a batch of simulations stepped in lockstep.
+    """
+
+    def decide(self, ship, level, package):
+        """
+        Choose the controls to hold for the next physics step.
+
+        Args:
+            ship: The Ship being flown
+            level: The current Level (pad position in level.pad_info)
+            package: The Package on board
+
+        Returns:
+            Tuple of (rotate_left, rotate_right, thrust) booleans
+        """
+        return IDLE
+
+    def read(self, game):
+        """
+        Get the controls held this step (what GameState.handle_input calls).
+
+        Args:
+            game: The GameState being driven
+
+        Returns:
+            Tuple of (rotate_left, rotate_right, thrust) booleans
+        """
+        return self.decide(game.ship, game.level, game.package)
+
+
+class KeyboardInput(Controller):
+    """Reads the held A/D/W keys from the keyboard (the normal way to play)."""
+
+    def decide(self, ship, level, package):
+        """Get the controls held on the keyboard (the game state is ignored)."""
+        import pygame  # Only the windowed game reads the keyboard
+        keys = pygame.key.get_pressed()
+        return keys[pygame.K_a], keys[pygame.K_d], keys[pygame.K_w]
+
+
+class ScriptedInput(Controller):
+    """
+    Plays back a fixed list of per-frame controls.
+    Used for headless simulation where there is no keyboard.
+    """
+
+    def __init__(self, frames):
+        """
+        Initialize a scripted input source.
+
+        Args:
+            frames: Iterable of (rotate_left, rotate_right, thrust) tuples,
+                    one per frame. After the script runs out, nothing is held.
+        """
+        self.frames = iter(frames)
+
+    def decide(self, ship, level, package):
+        """Get the next scripted frame of controls."""
+        return next(self.frames, IDLE)
@@ -0,0 +1,213 @@
+# game_state.py - Everything about a game except showing it
+# The seeds, the current delivery, and stepping it through the descent.
+# Needs no pygame, so simulations and worker processes can run it as is.
+
+import os
+import random
+from constants import (
+    PHYSICS_TIMESTEP, PHYSICS_TUNING_HZ,
+    STATE_ORBIT, STATE_DESCENT, STATE_RATING, STATE_GAME_OVER,
+    LANDING_PAD_Y, FALLING_FAST_VELOCITY
+)
+from physics import integrate_ship, landing_status, LANDING_FLYING, LANDING_LANDED
+from ship import Ship
+from level import StarField
+from level_pipeline import LevelPipeline
+from controls import Controller
+from recording import Recording
+
+
+class GameState:
+    """
+    The game's state machine and simulation, with no window.
+    main.Game adds the window, events and drawing on top.
+
+    Drive it with handle_input() and update(), one physics step at a time.
+    """
+
+    def __init__(self, controller=None, seed=None, record_dir=None):
+        """
+        Initialize the game state.
+
+        Args:
+            controller: controls.Controller that flies the ship (like
+                        autopilot.Autopilot). Defaults to holding nothing.
+            seed: Seed for everything random (levels, packages, stars).
+                  The same seed always plays out the same deliveries.
+                  None picks a fresh seed each run.
+            record_dir: Folder to save a Recording of every finished
+                        delivery into (see recording.py), or None
+        """
+        self.controller = controller or Controller()
+
+        # Random streams: gameplay draws from self.rng, while flame flicker
+        # and debris get their own stream so drawing can't change the game
+        self.rng = random.Random(seed)
+        self.cosmetic_rng = random.Random(self.rng.getrandbits(32))
+        self.delivery_seed = None  # Seed of the current delivery's level and package
+        self._next_seed = None     # Next delivery's seed, if drawn early to prepare it
+
+        # Builds the next level ahead of time (see prepare_next_delivery)
+        self.level_pipeline = LevelPipeline()
+
+        # Controls held on every physics step of the current delivery
+        self.recording = None
+        self.record_dir = record_dir
+
+        # Game state
+        self.state = "title"  # title, orbit, descent, rating, game_over
+        self.difficulty = 1
+
+        # Game objects
+        self.ship = Ship(rng=self.cosmetic_rng)
+        self.package = None
+        self.level = None
+        self.star_field = StarField(rng=self.rng)
+
+        # Delivery tracking
+        self.landed_successfully = False
+
+        # Held rotation controls, applied on each physics step
+        self.rotating_left = False
+        self.rotating_right = False
+
+    def new_delivery(self, seed=None):
+        """
+        Set up a new delivery attempt.
+
+        Args:
+            seed: Delivery seed to rebuild a particular level and package
+                  (like a Recording's), or None for the next one in sequence
+        """
+        # Each delivery gets its own seed, so one can be rebuilt on its own
+        self.delivery_seed = self._take_next_seed() if seed is None else seed
+        self.recording = Recording(self.difficulty, self.delivery_seed)
+
+        # Level, package, and where the ship starts (already built if the
+        # pipeline got to it while the last rating was shown)
+        self.ship.reset()
+        self.package, self.level, self.ship.x = self.level_pipeline.take(
+            self.difficulty, self.delivery_seed)
+        self.ship.y = 80
+        self.ship.save_previous()  # Nothing to interpolate from yet
+
+        self.landed_successfully = False
+        self.state = STATE_ORBIT
+
+    def _take_next_seed(self):
+        """Draw the next delivery seed, or use the one drawn early to prepare it."""
+        seed, self._next_seed = self._next_seed, None
+        return self.rng.getrandbits(32) if seed is None else seed
+
+    def handle_input(self):
+        """Read which controls the controller holds for the next physics step."""
+        if self.state != STATE_DESCENT:
+            return
+
+        rotate_left, rotate_right, thrust = self.controller.read(self)
+
+        # Rotation (applied in update, once per physics step)
+        self.rotating_left = rotate_left
+        self.rotating_right = rotate_right
+
+        # Thrust
+        self.ship.thrusting = thrust and self.ship.can_thrust()
+
+    def update(self):
+        """Advance game state by one fixed physics step (PHYSICS_TIMESTEP)."""
+        if self.state != STATE_DESCENT:
+            return
+
+        # The controls are all it takes to replay this step later
+        self.recording.record(self.rotating_left, self.rotating_right, self.ship.thrusting)
+
+        self._step()
+
+        if self.state != STATE_DESCENT:
+            self._finish_delivery()
+
+    def _step(self):
+        """
+        Move the ship one physics step and check how the descent is going.
+        Runs on every step, so it changes the ship in place and builds no
+        new objects (benchmarks.py checks that it allocates nothing).
+        """
+        # Physics values are tuned per frame at PHYSICS_TUNING_HZ
+        dt = PHYSICS_TIMESTEP * PHYSICS_TUNING_HZ
+        ship = self.ship
+
+        # Remember where we were, so drawing can interpolate
+        ship.save_previous()
+
+        # Rotation
+        if self.rotating_left:
+            ship.rotate_left(dt)
+        if self.rotating_right:
+            ship.rotate_right(dt)
+
+        # Gravity, thrust (if thrusting and there's fuel left), and position
+        delta_v = integrate_ship(ship, dt)
+
+        # Track delta-v for fragile packages
+        if delta_v and self.package:
+            self.package.add_delta_v(delta_v)
+
+        # Keep ship inside the world horizontally
+        ship.x = max(20, min(self.level.width - 20, ship.x))
+
+        # Update package time
+        if self.package:
+            self.package.add_time(PHYSICS_TIMESTEP)
+
+        # Check for terrain collision (hills/valleys) along this step's path
+        hit_time = self.level.sweep_terrain(ship.prev_x, ship.prev_y, ship.x, ship.y)
+        if hit_time is not None:
+            # Stop the ship where it touched the ground
+            ship.x = ship.prev_x + (ship.x - ship.prev_x) * hit_time
+            ship.y = ship.prev_y + (ship.y - ship.prev_y) * hit_time
+            self.landed_successfully = False
+            if self.package:
+                self.package.mark_crashed()
+            self.state = STATE_RATING
+            return
+
+        # Check for landing/crash on pad
+        status = landing_status(ship.x, ship.y, ship.vel_x, ship.vel_y, self.level.pad_info)
+
+        if status == LANDING_LANDED:
+            self.landed_successfully = True
+            self.state = STATE_RATING
+
+        elif status != LANDING_FLYING:
+            # Too fast onto the pad, or missed it
+            self.landed_successfully = False
+            if self.package:
+                self.package.mark_crashed()
+            self.state = STATE_RATING
+
+        # Check for out of fuel while still high up
+        if ship.fuel <= 0 and ship.y < LANDING_PAD_Y - 100:
+            # Let them fall a bit, but eventually game over
+            if ship.vel_y > FALLING_FAST_VELOCITY:
+                self.state = STATE_GAME_OVER
+
+    def _finish_delivery(self):
+        """Store the outcome in the recording, and save it if asked to."""
+        self.recording.finish(self.state, self.landed_successfully,
+                              self.package.calculate_rating())
+
+        if self.record_dir:
+            os.makedirs(self.record_dir, exist_ok=True)
+            filename = f"delivery-{self.difficulty}-{self.delivery_seed:08x}.odr"
+            self.recording.save(os.path.join(self.record_dir, filename))
+
+    def prepare_next_delivery(self):
+        """
+        Start building the next delivery in the background, for the
+        difficulty it will have (one up after a rating, back to 1 after
+        game over). Seeds come from self.rng in the same order either way,
+        so this changes nothing about the deliveries.
+        """
+        next_difficulty = self.difficulty + 1 if self.state == STATE_RATING else 1
+        self._next_seed = self._take_next_seed()
+        self.level_pipeline.prepare(next_difficulty, self._next_seed)
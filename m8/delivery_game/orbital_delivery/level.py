@@ -2,39 +2,53 @@
 
 import random
 import math
-import pygame
+from collections import OrderedDict, namedtuple
+
+try:
+    import numpy as np  # Optional - only used for bulk height queries
+except ImportError:
+    np = None
+
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, CAMERA_DEADZONE, WORLD_WIDTH,
     LANDING_PAD_WIDTH, LANDING_PAD_HEIGHT, LANDING_PAD_Y,
     TERRAIN_HEIGHT_BASE, TERRAIN_HEIGHT_PER_LEVEL, MAX_TERRAIN_HEIGHT,
-    TERRAIN_FLAT_ZONE_MARGIN, TERRAIN_TRANSITION_WIDTH,
+    TERRAIN_FLAT_ZONE_MARGIN, TERRAIN_TRANSITION_WIDTH, TERRAIN_RESOLUTION,
+    TERRAIN_CHUNK_WIDTH, TERRAIN_CHUNK_CACHE_SIZE,
     TERRAIN_WAVE_PRIMARY_FREQ, TERRAIN_WAVE_PRIMARY_AMP,
     TERRAIN_WAVE_SECONDARY_FREQ, TERRAIN_WAVE_SECONDARY_AMP,
     TERRAIN_WAVE_TERTIARY_FREQ, TERRAIN_WAVE_TERTIARY_AMP,
-    LATERAL_OFFSET_PER_LEVEL, MAX_LATERAL_OFFSET, SHIP_SCREEN_MARGIN,
-    GREEN, GRAY, DARK_GRAY, WHITE
+    LATERAL_OFFSET_PER_LEVEL, MAX_LATERAL_OFFSET, SHIP_SCREEN_MARGIN, SHIP_SIZE
 )
+from physics import segment_hit_time, SEGMENT_UNDER
+
+# Where a level's landing pad is, worked out once when the level is built.
+# A tuple, so it can be shared without anyone changing it.
+PadInfo = namedtuple("PadInfo", ["x", "y", "width", "height", "center_x"])
 
 
 class LandingPad:
     """Represents the landing zone target."""
 
-    def __init__(self, x=None, width=LANDING_PAD_WIDTH):
+    def __init__(self, x=None, width=LANDING_PAD_WIDTH, rng=None, world_width=WORLD_WIDTH):
         """
         Initialize landing pad.
 
         Args:
             x: X position (left edge). If None, randomized.
             width: Width of the pad
+            rng: random.Random to place the pad with (defaults to the random module)
+            world_width: Width of the world the pad is placed in
         """
+        rng = rng or random
         self.width = width
         self.height = LANDING_PAD_HEIGHT
         self.y = LANDING_PAD_Y
 
         if x is None:
-            # Random position, but keep pad on screen with margin for terrain
+            # Random position, but keep pad in the world with margin for terrain
             margin = 80
-            self.x = random.randint(margin, SCREEN_WIDTH - margin - self.width)
+            self.x = rng.randint(margin, world_width - margin - self.width)
         else:
             self.x = x
 
@@ -52,41 +66,67 @@ class LandingPad:
             self.x + self.width + TERRAIN_FLAT_ZONE_MARGIN
         )
 
-    def draw(self, surface):
-        """Draw the landing pad."""
-        # Main pad surface
-        pad_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(surface, GREEN, pad_rect)
 
-        # Pad border/markings
-        pygame.draw.rect(surface, WHITE, pad_rect, 2)
+class TerrainChunk:
+    """
+    One fixed-width piece of terrain: its points, plus each segment's line
+    (y = slope * x + intercept) for constant-time height lookups.
+    """
+
+    def __init__(self, points):
+        """
+        Initialize a chunk.
+
+        Args:
+            points: Evenly spaced (x, y) points, left to right. The last one
+                    is also the first point of the next chunk.
+        """
+        self.points = points
+        self.slopes = []
+        self.intercepts = []
+
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            slope = (y2 - y1) / (x2 - x1)
+            self.slopes.append(slope)
+            self.intercepts.append(y1 - slope * x1)
 
-        # Landing lights (small circles on each end)
-        light_radius = 4
-        pygame.draw.circle(surface, WHITE,
-                           (self.x + light_radius + 2, self.y + self.height // 2),
-                           light_radius)
-        pygame.draw.circle(surface, WHITE,
-                           (self.x + self.width - light_radius - 2, self.y + self.height // 2),
-                           light_radius)
+        # Array copies for Terrain.heights_at()
+        if np is not None:
+            self.slope_array = np.array(self.slopes)
+            self.intercept_array = np.array(self.intercepts)
 
 
 class Terrain:
     """
     Terrain with hills and valleys that scale with difficulty.
     Provides collision detection via height lookup.
+
+    The world can be many screens wide, so terrain is generated in chunks
+    of TERRAIN_CHUNK_WIDTH pixels only when something looks at them. Each
+    chunk is built from the terrain seed and its index, so a chunk that
+    was dropped from the cache comes back exactly the same, and memory
+    stays the same however far the ship flies.
     """
 
-    def __init__(self, difficulty=1, flat_zone=None):
+    def __init__(self, difficulty=1, flat_zone=None, resolution=TERRAIN_RESOLUTION,
+                 rng=None, width=WORLD_WIDTH, cache_size=TERRAIN_CHUNK_CACHE_SIZE):
         """
         Initialize terrain with difficulty-based variation.
 
         Args:
             difficulty: Level difficulty (1+), affects terrain roughness
             flat_zone: (left_x, right_x) tuple for flat landing area, or None
+            resolution: Number of evenly spaced segments across one screen width
+            rng: random.Random to pick the terrain seed with (defaults to the random module)
+            width: Width of the world in pixels
+            cache_size: Most generated chunks to keep at once
         """
+        self.rng = rng or random
         self.difficulty = difficulty
         self.flat_zone = flat_zone
+        self.resolution = resolution
+        self.width = width
+        self.cache_size = cache_size
         self.base_y = LANDING_PAD_Y + LANDING_PAD_HEIGHT
 
         # Calculate terrain roughness based on difficulty
@@ -95,74 +135,169 @@ class Terrain:
             MAX_TERRAIN_HEIGHT
         )
 
+        # Highest the hills can possibly reach (all three waves peaking at once)
+        self.top = self.base_y - self.height_variation * (
+            TERRAIN_WAVE_PRIMARY_AMP + TERRAIN_WAVE_SECONDARY_AMP + TERRAIN_WAVE_TERTIARY_AMP)
+
+        # Points are evenly spaced in x, so the segment under any x is just
+        # x // segment_width, and its chunk is segment // chunk_segments
+        self._segment_width = SCREEN_WIDTH / resolution
+        self._chunk_segments = max(1, round(TERRAIN_CHUNK_WIDTH / self._segment_width))
+        self.chunk_width = self._chunk_segments * self._segment_width
+        self.chunk_count = max(1, math.ceil(width / self.chunk_width))
+        self._segment_count = self.chunk_count * self._chunk_segments
+
         self.generate_terrain()
 
     def generate_terrain(self):
         """
-        Generate terrain with smooth hills and valleys.
+        Start a new terrain: pick its seed and forget any generated chunks.
+        Chunks are then generated from the seed as they're needed.
+        """
+        self.seed = self.rng.getrandbits(32)
+        self._chunks = OrderedDict()
+        self._recent = (None, None)  # (index, chunk) last asked for
+
+    def generate_chunk(self, index):
+        """
+        Generate one chunk of terrain with smooth hills and valleys.
         Uses multiple sine waves for natural-looking terrain.
+
+        Args:
+            index: Which chunk (0 is the left edge of the world)
+
+        Returns:
+            TerrainChunk
         """
-        self.points = []
-        num_points = 50  # More points for smoother terrain
+        first = index * self._chunk_segments
+        last = first + self._chunk_segments
+        chunk_rng = self._chunk_rng(index)
 
-        # Generate base terrain using layered sine waves
-        for i in range(num_points + 1):
-            x = (i / num_points) * SCREEN_WIDTH
+        points = []
+        for i in range(first, last + 1):
+            if i == last:
+                # The shared edge point belongs to the next chunk, so both agree on it
+                chunk_rng = self._chunk_rng(index + 1)
+            x = i * self._segment_width
+            points.append((x, self._generate_height(x, chunk_rng)))
 
-            # Skip detailed generation if in flat zone
-            if self.flat_zone and self.flat_zone[0] <= x <= self.flat_zone[1]:
-                y = self.base_y
-            else:
-                # Layer multiple frequencies for natural terrain
-                y_offset = 0
+        return TerrainChunk(points)
 
-                # Primary wave (large hills)
-                y_offset += (math.sin(x * TERRAIN_WAVE_PRIMARY_FREQ + random.random() * 0.5)
-                             * self.height_variation * TERRAIN_WAVE_PRIMARY_AMP)
+    def _chunk_rng(self, index):
+        """Random stream for one chunk, the same every time it's generated."""
+        return random.Random(self.seed << 32 | index)
 
-                # Secondary wave (medium features)
-                y_offset += (math.sin(x * TERRAIN_WAVE_SECONDARY_FREQ + random.random())
-                             * self.height_variation * TERRAIN_WAVE_SECONDARY_AMP)
+    def _generate_height(self, x, chunk_rng):
+        """
+        Terrain height at one point.
 
-                # Tertiary wave (small bumps)
-                y_offset += (math.sin(x * TERRAIN_WAVE_TERTIARY_FREQ + random.random() * 2)
-                             * self.height_variation * TERRAIN_WAVE_TERTIARY_AMP)
+        Args:
+            x: X coordinate of the point
+            chunk_rng: The chunk's random stream (three numbers are used per point)
+
+        Returns:
+            Y coordinate of the terrain surface
+        """
+        # Always use the same random numbers per point, flat or not, so each
+        # point's hills don't depend on where the flat zone is
+        primary_phase = chunk_rng.random() * 0.5
+        secondary_phase = chunk_rng.random()
+        tertiary_phase = chunk_rng.random() * 2
+
+        # Flat for landing
+        if self.flat_zone and self.flat_zone[0] <= x <= self.flat_zone[1]:
+            return self.base_y
+
+        # Layer multiple frequencies for natural terrain
+        y_offset = 0
 
-                y = self.base_y - y_offset  # Negative because y increases downward
+        # Primary wave (large hills)
+        y_offset += (math.sin(x * TERRAIN_WAVE_PRIMARY_FREQ + primary_phase)
+                     * self.height_variation * TERRAIN_WAVE_PRIMARY_AMP)
 
-            self.points.append((x, y))
+        # Secondary wave (medium features)
+        y_offset += (math.sin(x * TERRAIN_WAVE_SECONDARY_FREQ + secondary_phase)
+                     * self.height_variation * TERRAIN_WAVE_SECONDARY_AMP)
+
+        # Tertiary wave (small bumps)
+        y_offset += (math.sin(x * TERRAIN_WAVE_TERTIARY_FREQ + tertiary_phase)
+                     * self.height_variation * TERRAIN_WAVE_TERTIARY_AMP)
+
+        y = self.base_y - y_offset  # Negative because y increases downward
 
         # Smooth transition into flat zone
         if self.flat_zone:
-            self._smooth_flat_zone_edges()
-
-    def _smooth_flat_zone_edges(self):
-        """Create smooth transitions at flat zone boundaries."""
-        if not self.flat_zone:
-            return
+            y = self._smooth_flat_zone_edge(x, y)
+        return y
 
+    def _smooth_flat_zone_edge(self, x, y):
+        """Blend a point near the flat zone toward flat ground."""
         flat_left, flat_right = self.flat_zone
         transition_width = TERRAIN_TRANSITION_WIDTH
 
-        for i, (x, y) in enumerate(self.points):
-            # Left transition (approaching flat zone)
-            if flat_left - transition_width < x < flat_left:
-                t = (x - (flat_left - transition_width)) / transition_width
-                t = t * t * (3 - 2 * t)  # Smoothstep
-                new_y = y * (1 - t) + self.base_y * t
-                self.points[i] = (x, new_y)
-
-            # Right transition (leaving flat zone)
-            elif flat_right < x < flat_right + transition_width:
-                t = (x - flat_right) / transition_width
-                t = t * t * (3 - 2 * t)  # Smoothstep
-                new_y = self.base_y * (1 - t) + y * t
-                self.points[i] = (x, new_y)
+        # Left transition (approaching flat zone)
+        if flat_left - transition_width < x < flat_left:
+            t = (x - (flat_left - transition_width)) / transition_width
+            t = t * t * (3 - 2 * t)  # Smoothstep
+            return y * (1 - t) + self.base_y * t
+
+        # Right transition (leaving flat zone)
+        if flat_right < x < flat_right + transition_width:
+            t = (x - flat_right) / transition_width
+            t = t * t * (3 - 2 * t)  # Smoothstep
+            return self.base_y * (1 - t) + y * t
+
+        return y
+
+    def get_chunk(self, index):
+        """
+        Get a chunk, generating it if it isn't cached.
+        Least recently used chunks are dropped once cache_size is reached.
+
+        Args:
+            index: Which chunk (0 to chunk_count - 1)
+
+        Returns:
+            TerrainChunk
+        """
+        # Most lookups land in the same chunk as the one before
+        recent_index, chunk = self._recent
+        if index == recent_index:
+            return chunk
+
+        chunk = self._chunks.get(index)
+        if chunk is not None:
+            self._chunks.move_to_end(index)  # Most recently used
+        else:
+            chunk = self.generate_chunk(index)
+            self._chunks[index] = chunk
+            if len(self._chunks) > self.cache_size:
+                self._chunks.popitem(last=False)  # Drop least recently used
+
+        self._recent = (index, chunk)
+        return chunk
+
+    def prepare(self, x_min, x_max):
+        """
+        Generate the chunks covering an X range now, so they're ready
+        before anything needs them.
+
+        Args:
+            x_min, x_max: X range of interest
+        """
+        for index in self.chunks_between(x_min, x_max):
+            self.get_chunk(index)
+
+    def chunks_between(self, x_min, x_max):
+        """Indexes of the chunks covering an X range."""
+        first = min(int(max(0, x_min) / self.chunk_width), self.chunk_count - 1)
+        last = min(int(max(0, x_max) / self.chunk_width), self.chunk_count - 1)
+        return range(first, last + 1)
 
     def get_height_at(self, x):
         """
         Get terrain height (Y value) at a given X position.
-        Used for collision detection.
+        Used for collision detection. Constant time at any resolution.
 
         Args:
             x: X coordinate to check
@@ -171,35 +306,115 @@ class Terrain:
             Y coordinate of terrain surface at that X
         """
         # Clamp x to valid range
-        x = max(0, min(SCREEN_WIDTH, x))
+        x = max(0, min(self.width, x))
+
+        # Which segment is x over? (The right edge belongs to the last one)
+        segment = min(int(x / self._segment_width), self._segment_count - 1)
+        index = segment // self._chunk_segments
+        chunk = self.get_chunk(index)
+        i = segment - index * self._chunk_segments
+        return chunk.slopes[i] * x + chunk.intercepts[i]
 
-        # Find the two points this x falls between
-        for i in range(len(self.points) - 1):
-            x1, y1 = self.points[i]
-            x2, y2 = self.points[i + 1]
+    def heights_at(self, xs):
+        """
+        Get terrain heights for many X positions at once.
+
+        Args:
+            xs: Sequence (or NumPy array) of X coordinates
+
+        Returns:
+            NumPy array of Y coordinates, or a list if NumPy isn't installed
+        """
+        if np is None:
+            return [self.get_height_at(x) for x in xs]
+
+        xs = np.clip(np.asarray(xs, dtype=float), 0, self.width)
+        segments = np.minimum((xs / self._segment_width).astype(int), self._segment_count - 1)
+        indexes = segments // self._chunk_segments
+        heights = np.empty_like(xs)
+
+        # One lookup per chunk touched
+        for index in np.unique(indexes).tolist():
+            chunk = self.get_chunk(index)
+            here = indexes == index
+            i = segments[here] - index * self._chunk_segments
+            heights[here] = chunk.slope_array[i] * xs[here] + chunk.intercept_array[i]
+        return heights
+
+    def get_points_between(self, x_min, x_max):
+        """
+        Get the stretch of terrain polyline covering an X range.
+        Used as a collision broad phase - only these segments need testing,
+        and only the chunks under them get generated.
 
-            if x1 <= x <= x2:
-                # Linear interpolation
-                if x2 == x1:
-                    return y1
-                t = (x - x1) / (x2 - x1)
-                return y1 + t * (y2 - y1)
+        Args:
+            x_min, x_max: X range of interest
 
-        # Fallback
-        return self.base_y
+        Returns:
+            List of consecutive (x, y) terrain points spanning the range
+        """
+        first = int(max(0, x_min) / self._segment_width)
+        last = int(min(self.width, x_max) / self._segment_width) + 1
+        first = min(first, self._segment_count - 1)
+        last = max(first + 1, min(last, self._segment_count))
+
+        # Points first..last, taken from each chunk they fall in
+        points = []
+        i = first
+        while i <= last:
+            index = min(i // self._chunk_segments, self.chunk_count - 1)
+            start = index * self._chunk_segments
+            end = min(last, start + self._chunk_segments)
+            points += self.get_chunk(index).points[i - start:end - start + 1]
+            i = end + 1
+        return points
+
+    def sweep_collision(self, x0, y0, x1, y1, ship_margin=SHIP_SIZE):
+        """
+        Check if the ship hit the terrain while moving from (x0, y0) to (x1, y1).
+        Same answer as physics.sweep_terrain_collision over get_points_between(),
+        but reads the segments straight out of the chunks instead of building
+        lists and dictionaries, since the game asks on every physics step.
 
-    def draw(self, surface):
-        """Draw the terrain."""
-        # Draw filled ground
-        ground_points = self.points + [
-            (SCREEN_WIDTH, SCREEN_HEIGHT),
-            (0, SCREEN_HEIGHT)
-        ]
-        pygame.draw.polygon(surface, DARK_GRAY, ground_points)
+        Args:
+            x0, y0: Ship position at the start of the step
+            x1, y1: Ship position at the end of the step
+            ship_margin: Collision buffer around ship center
 
-        # Draw terrain surface line
-        if len(self.points) > 1:
-            pygame.draw.lines(surface, GRAY, False, self.points, 2)
+        Returns:
+            Fraction of the step (0.0 to 1.0) at which the ship hit, or None
+        """
+        # Above the highest the hills can reach the whole way: nothing to hit
+        if y0 < self.top and y1 < self.top:
+            return None
+
+        # The same segments get_points_between() would return
+        first = int(max(0, min(x0, x1) - ship_margin) / self._segment_width)
+        last = int(min(self.width, max(x0, x1) + ship_margin) / self._segment_width) + 1
+        first = min(first, self._segment_count - 1)
+        last = max(first + 1, min(last, self._segment_count))
+
+        move_x = x1 - x0
+        move_y = y1 - y0
+        hit_time = None
+
+        # Left of center, center, then right of center
+        for side in (-1, 0, 1):
+            start_x = x0 + side * ship_margin
+            for i in range(first, last):
+                index = i // self._chunk_segments
+                points = self.get_chunk(index).points
+                j = i - index * self._chunk_segments
+                ax, ay = points[j]
+                bx, by = points[j + 1]
+
+                t = segment_hit_time(start_x, y0, move_x, move_y, ax, ay, bx, by)
+                if t == SEGMENT_UNDER:
+                    return 0.0
+                if t is not None and (hit_time is None or t < hit_time):
+                    hit_time = t
+
+        return hit_time
 
 
 class Level:
@@ -208,14 +423,20 @@ class Level:
     Handles difficulty scaling for terrain, pad size, and ship position.
     """
 
-    def __init__(self, difficulty=1):
+    def __init__(self, difficulty=1, rng=None, width=WORLD_WIDTH):
         """
         Initialize a level.
 
         Args:
             difficulty: Difficulty level (1+), affects terrain, pad size, ship offset
+            rng: random.Random for everything random about the level, so the
+                 same seed always builds the same level (defaults to the
+                 random module)
+            width: Width of the world in pixels (SCREEN_WIDTH for a single screen)
         """
+        self.rng = rng or random
         self.difficulty = difficulty
+        self.width = width
 
         # Adjust pad width based on difficulty
         base_width = LANDING_PAD_WIDTH
@@ -223,26 +444,34 @@ class Level:
         pad_width = max(base_width - width_reduction, 50)  # Min 50px width
 
         # Create landing pad first
-        self.landing_pad = LandingPad(width=pad_width)
+        self.landing_pad = LandingPad(width=pad_width, rng=self.rng, world_width=width)
 
         # Create terrain with flat zone around pad
         flat_zone = self.landing_pad.get_flat_zone()
-        self.terrain = Terrain(difficulty=difficulty, flat_zone=flat_zone)
+        self.terrain = Terrain(difficulty=difficulty, flat_zone=flat_zone, rng=self.rng,
+                               width=width)
+
+        # The pad never moves, so its position is only worked out once
+        self.pad_info = PadInfo(self.landing_pad.x, self.landing_pad.y,
+                                self.landing_pad.width, self.landing_pad.height,
+                                self.landing_pad.get_center_x())
 
     def get_pad_info(self):
-        """Get landing pad position and size."""
-        return {
-            'x': self.landing_pad.x,
-            'y': self.landing_pad.y,
-            'width': self.landing_pad.width,
-            'height': self.landing_pad.height,
-            'center_x': self.landing_pad.get_center_x()
-        }
+        """Get landing pad position and size, as a new dictionary (see pad_info)."""
+        return self.pad_info._asdict()
 
     def get_terrain_height(self, x):
         """Get terrain height at given X coordinate."""
         return self.terrain.get_height_at(x)
 
+    def get_terrain_points(self, x_min, x_max):
+        """Get the terrain points covering an X range (collision broad phase)."""
+        return self.terrain.get_points_between(x_min, x_max)
+
+    def sweep_terrain(self, x0, y0, x1, y1):
+        """Fraction of a step at which the ship hit terrain, or None (see Terrain.sweep_collision)."""
+        return self.terrain.sweep_collision(x0, y0, x1, y1)
+
     def get_ship_start_offset(self):
         """
         Calculate horizontal offset for ship starting position.
@@ -259,44 +488,82 @@ class Level:
         offset = min(base_offset, MAX_LATERAL_OFFSET)
 
         # Randomly choose left or right
-        direction = random.choice([-1, 1])
+        direction = self.rng.choice([-1, 1])
 
-        # Make sure ship starts on screen
+        # Make sure ship starts inside the world
         pad_center = self.landing_pad.get_center_x()
         proposed_x = pad_center + (offset * direction)
 
-        # Clamp to screen bounds with margin
+        # Clamp to world bounds with margin
         if proposed_x < SHIP_SCREEN_MARGIN:
             direction = 1  # Force right
-        elif proposed_x > SCREEN_WIDTH - SHIP_SCREEN_MARGIN:
+        elif proposed_x > self.width - SHIP_SCREEN_MARGIN:
             direction = -1  # Force left
 
         return offset * direction
 
-    def draw(self, surface):
-        """Draw the complete level."""
-        self.terrain.draw(surface)
-        self.landing_pad.draw(surface)
-
 
 class StarField:
     """Background star field for atmosphere."""
 
-    def __init__(self, num_stars=100):
-        """Generate random star positions."""
+    def __init__(self, num_stars=100, rng=None):
+        """
+        Generate random star positions.
+
+        Args:
+            num_stars: How many stars to scatter
+            rng: random.Random to place them with (defaults to the random module)
+        """
+        rng = rng or random
         self.stars = []
         for _ in range(num_stars):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT - 100)  # Keep above ground
-            brightness = random.randint(100, 255)
-            size = random.choice([1, 1, 1, 2])  # Most stars are small
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT - 100)  # Keep above ground
+            brightness = rng.randint(100, 255)
+            size = rng.choice([1, 1, 1, 2])  # Most stars are small
             self.stars.append((x, y, brightness, size))
 
-    def draw(self, surface):
-        """Draw the star field."""
-        for x, y, brightness, size in self.stars:
-            color = (brightness, brightness, brightness)
-            if size == 1:
-                surface.set_at((x, y), color)
-            else:
-                pygame.draw.circle(surface, color, (x, y), size)
+
+class Camera:
+    """
+    Which part of the world is on screen. Follows the ship sideways, but
+    only once it gets more than CAMERA_DEADZONE from the middle of the
+    screen, so the view holds still while the ship hovers over the pad.
+    """
+
+    def __init__(self, world_width=WORLD_WIDTH):
+        """
+        Initialize the camera at the left edge of the world.
+
+        Args:
+            world_width: Width of the world in pixels
+        """
+        self.world_width = world_width
+        self.x = 0  # World X coordinate of the screen's left edge
+
+    def center_on(self, x):
+        """Jump straight to a view centered on a world X coordinate."""
+        self.x = self._clamp(x - SCREEN_WIDTH / 2)
+
+    def follow(self, x):
+        """
+        Scroll just enough to keep a world X coordinate near the middle.
+
+        Args:
+            x: World X coordinate to follow (the ship's)
+
+        Returns:
+            True if the view moved
+        """
+        offset = x - (self.x + SCREEN_WIDTH / 2)
+        if abs(offset) <= CAMERA_DEADZONE:
+            return False
+
+        new_x = self._clamp(self.x + offset - math.copysign(CAMERA_DEADZONE, offset))
+        moved = new_x != self.x
+        self.x = new_x
+        return moved
+
+    def _clamp(self, x):
+        """Keep the view inside the world, on whole pixels."""
+        return round(max(0, min(self.world_width - SCREEN_WIDTH, x)))
@@ -0,0 +1,127 @@
+# level_pipeline.py - Builds the next delivery's level while the player reads the rating
+# Pressing SPACE then just picks up a level that's already built, instead of
+# generating one (and the terrain around the ship) on that frame
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from constants import SCREEN_WIDTH, SHIP_SCREEN_MARGIN
+from package import create_random_package
+from level import Level, Camera
+
+# Longest take() waits for the matching delivery to finish, in seconds, before
+# building it itself. Building takes milliseconds, so this only runs out if
+# the worker is stuck.
+TAKE_TIMEOUT = 1.0
+
+
+def build_delivery(difficulty, seed):
+    """
+    Build everything random about a delivery from its seed.
+    Gives the same result whichever thread it runs on.
+
+    Args:
+        difficulty: Level difficulty (1+)
+        seed: Delivery seed (see GameState.new_delivery)
+
+    Returns:
+        Tuple of (package, level, ship_x) where ship_x is the ship's
+        starting X position
+    """
+    delivery_rng = random.Random(seed)
+    package = create_random_package(delivery_rng)
+    level = Level(difficulty, delivery_rng)
+
+    # Position ship with lateral offset based on difficulty
+    ship_x = level.pad_info.center_x + level.get_ship_start_offset()
+
+    # Final safety clamp to world bounds
+    ship_x = max(SHIP_SCREEN_MARGIN, min(level.width - SHIP_SCREEN_MARGIN, ship_x))
+
+    # Generate the terrain the first frame will show
+    camera = Camera(level.width)
+    camera.center_on(ship_x)
+    level.terrain.prepare(camera.x, camera.x + SCREEN_WIDTH)
+
+    return package, level, ship_x
+
+
+class LevelPipeline:
+    """
+    Builds one delivery ahead on a worker thread.
+
+    Usage:
+        pipeline.prepare(difficulty, seed)   # When the rating screen appears
+        ...
+        package, level, ship_x = pipeline.take(difficulty, seed)
+
+    If the worker is still building the delivery take() asks for, take()
+    waits for it rather than building it a second time. A different
+    delivery, a failed build, or one not done within TAKE_TIMEOUT is
+    built right away instead.
+    """
+
+    def __init__(self):
+        """Initialize the pipeline (the worker thread starts on first use)."""
+        self._executor = None
+        self._pending = None  # (difficulty, seed, future) being built
+        self.hits = 0         # Deliveries that were ready in time
+        self.misses = 0       # Deliveries built in take() itself
+
+    def prepare(self, difficulty, seed):
+        """
+        Start building a delivery in the background.
+        Replaces any delivery that was being prepared before.
+
+        Args:
+            difficulty: Level difficulty (1+)
+            seed: Delivery seed
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="level-pipeline")
+        self._discard()
+        future = self._executor.submit(build_delivery, difficulty, seed)
+        self._pending = (difficulty, seed, future)
+
+    def take(self, difficulty, seed):
+        """
+        Get a delivery: the prepared one if it matches (waiting for it
+        to finish), otherwise one built now.
+
+        Args:
+            difficulty: Level difficulty (1+)
+            seed: Delivery seed
+
+        Returns:
+            Tuple of (package, level, ship_x), see build_delivery
+        """
+        if self._pending is not None:
+            pending_difficulty, pending_seed, future = self._pending
+            if (pending_difficulty, pending_seed) == (difficulty, seed):
+                try:
+                    delivery = future.result(timeout=TAKE_TIMEOUT)
+                except Exception:
+                    # Failed or stuck: build it below instead (a real error
+                    # then happens again here, where the game can see it)
+                    pass
+                else:
+                    self._pending = None
+                    self.hits += 1
+                    return delivery
+            self._discard()
+
+        self.misses += 1
+        return build_delivery(difficulty, seed)
+
+    def shutdown(self):
+        """Stop the worker thread, dropping anything not yet built."""
+        self._discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _discard(self):
+        """Forget the delivery being prepared (skipping it if it hasn't started)."""
+        if self._pending is not None:
+            self._pending[2].cancel()
+            self._pending = None
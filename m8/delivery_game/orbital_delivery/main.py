@@ -6,75 +6,124 @@ Entry point and main game loop.
 Demonstrates modular Python game architecture with clean separation of concerns.
 """
 
+import argparse
 import pygame
 import sys
+from functools import cached_property
 
 # Import game modules
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DIRTY_RECT_RENDERING,
+    PHYSICS_TIMESTEP, MAX_FRAME_TIME,
     STATE_ORBIT, STATE_DESCENT, STATE_RATING, STATE_GAME_OVER,
-    LANDING_PAD_Y, FALLING_FAST_VELOCITY, SHIP_SCREEN_MARGIN
+    LANDING_PAD_Y, PROFILER_TRACE_FILE
 )
-from physics import (
-    apply_gravity, apply_thrust, update_position, check_landing,
-    get_altitude, check_terrain_collision
-)
-from ship import Ship
-from package import create_random_package
-from level import Level, StarField
-from ui import HUD, MenuScreen, RatingScreen, GameOverScreen
+from physics import get_altitude
+from game_state import GameState
+from level import Camera
+from render import BackgroundLayer, draw_ship, draw_crashed_ship
+from ui import HUD, MenuScreen, RatingScreen, GameOverScreen, ProfilerOverlay
+from controls import Controller, KeyboardInput
+from profiler import FrameProfiler
 
 
-class Game:
+class Game(GameState):
     """
-    Main game class handling initialization, game loop, and state management.
+    Main game class: the window, the game loop, events and drawing, on top
+    of the game state and simulation in GameState.
     """
 
-    def __init__(self):
-        """Initialize Pygame and game objects."""
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Orbital Delivery")
-        self.clock = pygame.time.Clock()
-
-        # Game state
-        self.state = "title"  # title, orbit, descent, rating, game_over
+    def __init__(self, headless=False, controller=None, seed=None, record_dir=None):
+        """
+        Initialize Pygame and game objects.
+
+        Args:
+            headless: If True, open no window and build no UI. The game can
+                      then only be stepped with handle_input() and update()
+                      (game_state.GameState does the same without pygame).
+            controller: controls.Controller that flies the ship (like
+                        autopilot.Autopilot). Defaults to the keyboard, or
+                        to no controls at all when headless (there is no
+                        keyboard to read without a window).
+            seed: Seed for everything random (levels, packages, stars).
+                  The same seed always plays out the same deliveries.
+                  None picks a fresh seed each run.
+            record_dir: Folder to save a Recording of every finished
+                        delivery into (see recording.py), or None
+        """
+        if controller is None:
+            controller = Controller() if headless else KeyboardInput()
+        super().__init__(controller, seed, record_dir)
+        self.headless = headless
         self.running = True
-        self.difficulty = 1
-
-        # Game objects
-        self.ship = Ship()
-        self.package = None
-        self.level = None
-        self.star_field = StarField()
-
-        # UI components
-        self.hud = HUD()
-        self.menu = MenuScreen()
-        self.rating_screen = RatingScreen()
-        self.game_over_screen = GameOverScreen()
-
-        # Delivery tracking
-        self.landed_successfully = False
-
-    def new_delivery(self):
-        """Set up a new delivery attempt."""
-        self.ship.reset()
-        self.package = create_random_package()
-        self.level = Level(self.difficulty)
-
-        # Position ship with lateral offset based on difficulty
-        pad_info = self.level.get_pad_info()
-        lateral_offset = self.level.get_ship_start_offset()
-        self.ship.x = pad_info['center_x'] + lateral_offset
-        self.ship.y = 80
-
-        # Final safety clamp to screen bounds
-        self.ship.x = max(SHIP_SCREEN_MARGIN,
-                          min(SCREEN_WIDTH - SHIP_SCREEN_MARGIN, self.ship.x))
-
-        self.landed_successfully = False
-        self.state = STATE_ORBIT
+
+        if headless:
+            self.screen = None
+            self.clock = None
+        else:
+            # Only what the game uses (fonts start when the first one loads)
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Orbital Delivery")
+            self.clock = pygame.time.Clock()
+
+        # Pre-drawn stars and level, and which part of the world is shown
+        self.background = None if headless else BackgroundLayer(self.star_field)
+        self.camera = Camera()
+
+        # Frame timing, off until F3 is pressed
+        self.profiler = FrameProfiler()
+
+        # Screen areas drawn over the background last frame. None means
+        # the next frame must redraw the whole screen.
+        self.use_dirty_rects = DIRTY_RECT_RENDERING
+        self._dirty_rects = None
+
+    # UI components, each built the first time its state is drawn
+    # (so the title screen doesn't wait for the rest)
+
+    @cached_property
+    def menu(self):
+        """Title and orbit screens."""
+        return MenuScreen()
+
+    @cached_property
+    def hud(self):
+        """Fuel, velocity and altitude display for the descent."""
+        return HUD()
+
+    @cached_property
+    def rating_screen(self):
+        """Package review shown after landing or crashing."""
+        return RatingScreen()
+
+    @cached_property
+    def game_over_screen(self):
+        """Out of fuel screen."""
+        return GameOverScreen()
+
+    @cached_property
+    def profiler_overlay(self):
+        """Frame timing table (F3)."""
+        return ProfilerOverlay()
+
+    def new_delivery(self, seed=None):
+        """
+        Set up a new delivery attempt (see GameState.new_delivery) and
+        point the view at the ship.
+
+        Args:
+            seed: Delivery seed, or None for the next one in sequence
+        """
+        super().new_delivery(seed)
+
+        # Start with the ship in the middle of the view
+        self.camera = Camera(self.level.width)
+        self.camera.center_on(self.ship.x)
+
+        # New level, so the cached background must be redrawn
+        if self.background:
+            self.background.set_level(self.level, self.camera.x)
 
     def handle_events(self):
         """Process input events."""
@@ -82,6 +131,9 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._dirty_rects = None  # The window lost its contents
+
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == "title":
@@ -92,6 +144,14 @@ class Game:
                 elif event.key == pygame.K_SPACE:
                     self._handle_space_press()
 
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    self._dirty_rects = None  # Clear away the overlay
+
+                elif event.key == pygame.K_F4 and self.profiler.frames:
+                    count = self.profiler.export_chrome_trace(PROFILER_TRACE_FILE)
+                    print(f"Saved {count} profiler events to {PROFILER_TRACE_FILE}")
+
     def _handle_space_press(self):
         """Handle space bar press based on current state."""
         if self.state == "title":
@@ -108,162 +168,181 @@ class Game:
             self.difficulty = 1
             self.new_delivery()
 
-    def handle_input(self):
-        """Process held keys for continuous input."""
-        if self.state != STATE_DESCENT:
-            return
-
-        keys = pygame.key.get_pressed()
-
-        # Rotation
-        if keys[pygame.K_a]:
-            self.ship.rotate_left()
-        if keys[pygame.K_d]:
-            self.ship.rotate_right()
-
-        # Thrust
-        self.ship.thrusting = keys[pygame.K_w] and self.ship.can_thrust()
-
-    def update(self):
-        """Update game state."""
-        if self.state != STATE_DESCENT:
+    def _finish_delivery(self):
+        """Store the outcome, and build the next level while the rating is shown."""
+        super()._finish_delivery()
+        if not self.headless:
+            self.prepare_next_delivery()
+
+    def draw(self, alpha=1.0):
+        """
+        Render the current frame.
+
+        Args:
+            alpha: Fraction of a physics step since the last update, used to
+                   interpolate the ship between its last two positions
+        """
+        # Keep the ship in view. Scrolling moves everything, so the
+        # whole screen must be redrawn on frames where the view moves.
+        if self.state == STATE_DESCENT:
+            ship_x, _, _ = self.ship.get_render_pose(alpha)
+            if self.camera.follow(ship_x):
+                self.background.scroll_to(self.camera.x)
+                self._dirty_rects = None
+
+        # Mid-descent (while the view holds still) only the ship and HUD change
+        if self.state == STATE_DESCENT and self.use_dirty_rects \
+                and self._dirty_rects is not None:
+            self._draw_changes(alpha)
             return
 
-        # Apply physics
-        self.ship.vel_x, self.ship.vel_y = apply_gravity(
-            self.ship.vel_x, self.ship.vel_y)
-
-        # Apply thrust if thrusting
-        if self.ship.thrusting:
-            self.ship.vel_x, self.ship.vel_y, delta_v = apply_thrust(
-                self.ship.vel_x, self.ship.vel_y, self.ship.angle)
-            self.ship.consume_fuel()
-
-            # Track delta-v for fragile packages
-            if self.package:
-                self.package.add_delta_v(delta_v)
-
-        # Update position
-        self.ship.x, self.ship.y = update_position(
-            self.ship.x, self.ship.y, self.ship.vel_x, self.ship.vel_y)
-
-        # Keep ship on screen horizontally
-        self.ship.x = max(20, min(SCREEN_WIDTH - 20, self.ship.x))
-
-        # Update package time
-        if self.package:
-            self.package.add_time(1.0 / FPS)
-
-        # Check for terrain collision (hills/valleys)
-        if check_terrain_collision(self.ship.x, self.ship.y,
-                                    self.level.get_terrain_height):
-            self.landed_successfully = False
-            if self.package:
-                self.package.mark_crashed()
-            self.state = STATE_RATING
-            return
+        profiler = self.profiler
+        camera_x = self.camera.x
+        drawn = []
 
-        # Check for landing/crash on pad
-        pad_info = self.level.get_pad_info()
-        result = check_landing(
-            self.ship.x, self.ship.y,
-            self.ship.vel_x, self.ship.vel_y,
-            pad_info['x'], pad_info['y'],
-            pad_info['width'], pad_info['height']
-        )
-
-        if result['status'] == 'landed':
-            self.landed_successfully = True
-            self.state = STATE_RATING
-
-        elif result['status'] == 'crashed':
-            self.landed_successfully = False
-            if self.package:
-                self.package.mark_crashed()
-            self.state = STATE_RATING
-
-        elif result['status'] == 'missed':
-            self.landed_successfully = False
-            if self.package:
-                self.package.mark_crashed()
-            self.state = STATE_RATING
-
-        # Check for out of fuel while still high up
-        if self.ship.fuel <= 0 and self.ship.y < LANDING_PAD_Y - 100:
-            # Let them fall a bit, but eventually game over
-            if self.ship.vel_y > FALLING_FAST_VELOCITY:
-                self.state = STATE_GAME_OVER
-
-    def draw(self):
-        """Render the current frame."""
-        # Clear screen
-        self.screen.fill(BLACK)
-
-        # Always draw stars
-        self.star_field.draw(self.screen)
+        # Stars and level (pre-rendered), which also clears the screen
+        with profiler.span("draw.background"):
+            self.background.draw(self.screen)
 
         if self.state == "title":
-            self.menu.draw_title(self.screen)
+            with profiler.span("draw.ui"):
+                self.menu.draw_title(self.screen)
 
         elif self.state == STATE_ORBIT:
-            # Draw level and ship in background
-            if self.level:
-                self.level.draw(self.screen)
-            self.ship.draw(self.screen)
+            # Ship in front of the level
+            with profiler.span("draw.ship"):
+                draw_ship(self.screen, self.ship, camera_x=camera_x)
             # Draw orbit overlay
-            self.menu.draw_orbit(self.screen, self.package)
+            with profiler.span("draw.ui"):
+                self.menu.draw_orbit(self.screen, self.package)
 
         elif self.state == STATE_DESCENT:
-            # Draw level
-            if self.level:
-                self.level.draw(self.screen)
-
             # Draw ship
-            self.ship.draw(self.screen)
+            with profiler.span("draw.ship"):
+                drawn.append(draw_ship(self.screen, self.ship, alpha, camera_x))
 
             # Draw HUD
-            altitude = get_altitude(self.ship.y, LANDING_PAD_Y)
-            self.hud.draw(self.screen, self.ship, self.package, altitude)
+            with profiler.span("draw.ui"):
+                altitude = get_altitude(self.ship.y, LANDING_PAD_Y)
+                drawn += self.hud.draw(self.screen, self.ship, self.package, altitude)
 
         elif self.state == STATE_RATING:
-            # Draw final scene
-            if self.level:
-                self.level.draw(self.screen)
-
             # Draw ship (crashed or landed)
-            if self.landed_successfully:
-                self.ship.draw(self.screen)
-            else:
-                self.ship.draw_crashed(self.screen)
+            with profiler.span("draw.ship"):
+                if self.landed_successfully:
+                    draw_ship(self.screen, self.ship, camera_x=camera_x)
+                else:
+                    draw_crashed_ship(self.screen, self.ship, camera_x)
 
             # Draw rating overlay
-            self.rating_screen.draw(self.screen, self.package, self.landed_successfully)
+            with profiler.span("draw.ui"):
+                self.rating_screen.draw(self.screen, self.package, self.landed_successfully)
 
         elif self.state == STATE_GAME_OVER:
-            if self.level:
-                self.level.draw(self.screen)
-            self.ship.draw(self.screen)
-            self.game_over_screen.draw(self.screen)
+            with profiler.span("draw.ship"):
+                draw_ship(self.screen, self.ship, camera_x=camera_x)
+            with profiler.span("draw.ui"):
+                self.game_over_screen.draw(self.screen)
+
+        # Frame timings on top of everything
+        if profiler.enabled:
+            drawn.append(self.profiler_overlay.draw(self.screen, profiler))
 
         # Update display
-        pygame.display.flip()
+        with profiler.span("draw.flip"):
+            pygame.display.flip()
+
+        # The next descent frame can start from this one
+        self._dirty_rects = drawn if self.state == STATE_DESCENT else None
+
+    def _draw_changes(self, alpha):
+        """
+        Draw a descent frame by erasing last frame's ship and HUD with the
+        cached background, drawing them again, and sending only those areas
+        to the display. Looks exactly like a full redraw.
+
+        Args:
+            alpha: Fraction of a physics step since the last update
+        """
+        profiler = self.profiler
+
+        with profiler.span("draw.background"):
+            self.background.restore(self.screen, self._dirty_rects)
+
+        with profiler.span("draw.ship"):
+            drawn = [draw_ship(self.screen, self.ship, alpha, self.camera.x)]
+
+        with profiler.span("draw.ui"):
+            altitude = get_altitude(self.ship.y, LANDING_PAD_Y)
+            drawn += self.hud.draw(self.screen, self.ship, self.package, altitude)
+
+        if profiler.enabled:
+            drawn.append(self.profiler_overlay.draw(self.screen, profiler))
+
+        # Both where things were (now erased) and where they are now
+        with profiler.span("draw.flip"):
+            pygame.display.update(self._dirty_rects + drawn)
+
+        self._dirty_rects = drawn
 
     def run(self):
-        """Main game loop."""
+        """
+        Main game loop.
+        Physics runs in fixed PHYSICS_TIMESTEP steps no matter how long a
+        frame takes; leftover time carries over to the next frame.
+        """
+        accumulator = 0.0
+        profiler = self.profiler
         while self.running:
-            self.handle_events()
-            self.handle_input()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            # Seconds since last frame, capped so one long stall
+            # can't queue up an endless backlog of physics steps
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            accumulator += frame_time
+
+            # Frame timing covers the work, not the wait in clock.tick()
+            profiler.begin_frame()
+
+            with profiler.span("events"):
+                self.handle_events()
+            with profiler.span("input"):
+                self.handle_input()
+
+            with profiler.span("update"):
+                while accumulator >= PHYSICS_TIMESTEP:
+                    self.update()
+                    accumulator -= PHYSICS_TIMESTEP
+
+            with profiler.span("draw"):
+                self.draw(accumulator / PHYSICS_TIMESTEP)
+
+            profiler.end_frame()
 
+        self.level_pipeline.shutdown()
         pygame.quit()
         sys.exit()
 
 
 def main():
     """Entry point."""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Orbital Delivery")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="watch the reference pilot fly")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="play the same deliveries every time")
+    parser.add_argument("--record", metavar="DIR", default=None,
+                        help="save a replayable recording of each delivery here")
+    parser.add_argument("--profile", action="store_true",
+                        help="start with the frame profiler on (F3 toggles it)")
+    args = parser.parse_args()
+
+    controller = None
+    if args.autopilot:
+        from autopilot import Autopilot
+        controller = Autopilot()
+
+    game = Game(controller=controller, seed=args.seed, record_dir=args.record)
+    if args.profile:
+        game.profiler.toggle()
     game.run()
 
 
@@ -2,6 +2,7 @@
 # Each package evaluates its delivery and generates a review
 
 import random
+import struct
 from constants import (
     FRAGILE_EXCELLENT, FRAGILE_GOOD, FRAGILE_ACCEPTABLE, FRAGILE_POOR,
     URGENT_EXCELLENT, URGENT_GOOD, URGENT_ACCEPTABLE, URGENT_POOR,
@@ -9,20 +10,40 @@ from constants import (
     COMPLAINTS, URGENT_PRAISE, URGENT_COMPLAINTS
 )
 
+# Package.snapshot() layout: total_delta_v, delivery_time, crashed (17 bytes)
+PACKAGE_STATE = struct.Struct("<dd?")
+
 
 class Package:
     """
     Represents a package being delivered.
     Tracks delivery metrics and generates ratings/reviews.
+
+    Attributes live in __slots__, and the name table is shared by every
+    package, so each one only holds its own few values.
     """
 
-    def __init__(self, package_type="fragile"):
+    __slots__ = ("rng", "package_type", "total_delta_v", "delivery_time", "crashed",
+                 "_cached_review", "_cached_rating", "name")
+
+    # Package personality (for display), by package type
+    NAMES = {
+        "fragile": ("Delicate Vase", "Antique Clock", "Crystal Set",
+                    "Grandma's Ashes", "Prototype Sensor", "Fine China"),
+        "urgent": ("Vital Organs", "Pizza (HOT)", "Classified Intel",
+                   "Unstable Isotope", "Birthday Cake", "Live Specimen")
+    }
+
+    def __init__(self, package_type="fragile", rng=None):
         """
         Initialize a package.
 
         Args:
             package_type: Either "fragile" or "urgent"
+            rng: random.Random for the name and review wording
+                 (defaults to the random module)
         """
+        self.rng = rng or random
         self.package_type = package_type.lower()
         self.total_delta_v = 0.0  # Total acceleration experienced
         self.delivery_time = 0.0  # Time in seconds
@@ -33,13 +54,7 @@ class Package:
         self._cached_rating = None
 
         # Package personality (for display)
-        self.names = {
-            "fragile": ["Delicate Vase", "Antique Clock", "Crystal Set",
-                        "Grandma's Ashes", "Prototype Sensor", "Fine China"],
-            "urgent": ["Vital Organs", "Pizza (HOT)", "Classified Intel",
-                       "Unstable Isotope", "Birthday Cake", "Live Specimen"]
-        }
-        self.name = random.choice(self.names.get(self.package_type, ["Mystery Box"]))
+        self.name = self.rng.choice(self.NAMES.get(self.package_type, ("Mystery Box",)))
 
     def add_delta_v(self, delta_v):
         """Record acceleration experienced during delivery."""
@@ -53,6 +68,30 @@ class Package:
         """Mark that the delivery ended in a crash."""
         self.crashed = True
 
+    def snapshot(self):
+        """
+        Pack the delivery so far (delta-v, time, crashed) into bytes,
+        for restore() to bring back.
+
+        Returns:
+            PACKAGE_STATE.size bytes
+        """
+        return PACKAGE_STATE.pack(self.total_delta_v, self.delivery_time, self.crashed)
+
+    def restore(self, state, offset=0):
+        """
+        Put the delivery back the way a snapshot() found it. A cached
+        review no longer fits, so it's written again when next asked for.
+
+        Args:
+            state: Bytes from snapshot(), or a buffer holding many of them
+            offset: Where in the buffer this package's snapshot starts
+        """
+        self.total_delta_v, self.delivery_time, self.crashed = \
+            PACKAGE_STATE.unpack_from(state, offset)
+        self._cached_review = None
+        self._cached_rating = None
+
     def calculate_rating(self):
         """
         Calculate star rating (1-5) based on package type and delivery metrics.
@@ -126,49 +165,49 @@ class Package:
     def _generate_crash_review(self):
         """Generate review for a crashed delivery."""
         templates = [
-            f"I am now in {random.randint(3, 47)} pieces. {random.choice(COMPLAINTS)}",
-            f"Well, that happened. {random.choice(COMPLAINTS)}",
-            f"*sounds of settling debris* {random.choice(COMPLAINTS)}",
-            f"I regret choosing this carrier. {random.choice(COMPLAINTS)}",
-            f"My contents are now modern art. {random.choice(COMPLAINTS)}"
+            f"I am now in {self.rng.randint(3, 47)} pieces. {self.rng.choice(COMPLAINTS)}",
+            f"Well, that happened. {self.rng.choice(COMPLAINTS)}",
+            f"*sounds of settling debris* {self.rng.choice(COMPLAINTS)}",
+            f"I regret choosing this carrier. {self.rng.choice(COMPLAINTS)}",
+            f"My contents are now modern art. {self.rng.choice(COMPLAINTS)}"
         ]
-        return random.choice(templates)
+        return self.rng.choice(templates)
 
     def _generate_fragile_review(self, rating):
         """Generate review for fragile package based on rating."""
         if rating == 5:
-            adj = random.choice(POSITIVE_ADJECTIVES)
+            adj = self.rng.choice(POSITIVE_ADJECTIVES)
             return f"Pristine delivery! {adj} handling throughout. Would ship again!"
         elif rating == 4:
-            adj = random.choice(POSITIVE_ADJECTIVES)
+            adj = self.rng.choice(POSITIVE_ADJECTIVES)
             return f"{adj} work overall. Minor bumps, but I'm intact. Recommended."
         elif rating == 3:
-            sensation = random.choice(NEGATIVE_SENSATIONS)
-            closing = random.choice(NEUTRAL_CLOSINGS)
+            sensation = self.rng.choice(NEGATIVE_SENSATIONS)
+            closing = self.rng.choice(NEUTRAL_CLOSINGS)
             return f"Arrived intact, but felt {sensation} during descent. {closing}"
         elif rating == 2:
-            sensation = random.choice(NEGATIVE_SENSATIONS)
-            complaint = random.choice(COMPLAINTS)
+            sensation = self.rng.choice(NEGATIVE_SENSATIONS)
+            complaint = self.rng.choice(COMPLAINTS)
             return f"Experienced {sensation}. Some internal damage likely. {complaint}"
         else:
-            complaint = random.choice(COMPLAINTS)
-            return f"I survived, barely. Felt like {random.choice(NEGATIVE_SENSATIONS)}. {complaint}"
+            complaint = self.rng.choice(COMPLAINTS)
+            return f"I survived, barely. Felt like {self.rng.choice(NEGATIVE_SENSATIONS)}. {complaint}"
 
     def _generate_urgent_review(self, rating):
         """Generate review for urgent package based on rating."""
         time_str = f"{self.delivery_time:.1f}s"
         if rating == 5:
-            praise = random.choice(URGENT_PRAISE)
+            praise = self.rng.choice(URGENT_PRAISE)
             return f"{praise} Delivered in {time_str}. Exceptional speed!"
         elif rating == 4:
             return f"Good hustle! {time_str} delivery time. I approve."
         elif rating == 3:
             return f"Adequate timing at {time_str}. I've seen faster, but acceptable."
         elif rating == 2:
-            complaint = random.choice(URGENT_COMPLAINTS)
+            complaint = self.rng.choice(URGENT_COMPLAINTS)
             return f"{time_str}? {complaint}"
         else:
-            complaint = random.choice(URGENT_COMPLAINTS)
+            complaint = self.rng.choice(URGENT_COMPLAINTS)
             return f"{time_str} to deliver?! {complaint}"
 
     def get_description(self):
@@ -179,7 +218,14 @@ class Package:
             return f"URGENT: {self.name}\nTime is critical!"
 
 
-def create_random_package():
-    """Create a random package type."""
-    package_type = random.choice(["fragile", "urgent"])
-    return Package(package_type)
+def create_random_package(rng=None):
+    """
+    Create a random package type.
+
+    Args:
+        rng: random.Random to pick the type (and the package's name) with
+             (defaults to the random module)
+    """
+    rng = rng or random
+    package_type = rng.choice(["fragile", "urgent"])
+    return Package(package_type, rng)
@@ -1,9 +1,20 @@
 # physics.py - Pure functions for gravity, thrust, and collision
 # No side effects - takes state in, returns new state
+# (except integrate_ship, the in-place version the game runs every step)
 
 import math
 from constants import GRAVITY, THRUST_POWER, MAX_LANDING_VELOCITY, SHIP_SIZE
 
+# Landing outcomes from landing_status(), as small codes (names in LANDING_STATUS_NAMES)
+LANDING_FLYING = 0
+LANDING_LANDED = 1
+LANDING_CRASHED = 2
+LANDING_MISSED = 3
+LANDING_STATUS_NAMES = ["flying", "landed", "crashed", "missed"]
+
+# segment_hit_time() result for a point that starts on or under the segment
+SEGMENT_UNDER = -1.0
+
 
 def apply_gravity(vel_x, vel_y, dt=1.0):
     """
@@ -63,6 +74,41 @@ def update_position(x, y, vel_x, vel_y, dt=1.0):
     return x + vel_x * dt, y + vel_y * dt
 
 
+def integrate_ship(ship, dt=1.0):
+    """
+    Move a ship one physics step, changing it in place: gravity, then thrust
+    (burning fuel) if it's thrusting, then position. Gives exactly the same
+    numbers as apply_gravity, apply_thrust and update_position, without
+    building a tuple for each.
+
+    Args:
+        ship: Ship to move (its thrusting flag says whether to thrust)
+        dt: Delta time multiplier
+
+    Returns:
+        Delta-v of the thrust applied, or 0.0 if there was none
+    """
+    vel_y = ship.vel_y + GRAVITY * dt
+    vel_x = ship.vel_x
+    delta_v = 0.0
+
+    # Fuel can run out between input reads
+    if ship.thrusting and ship.can_thrust():
+        angle_rad = math.radians(ship.angle - 90)
+        thrust_x = math.cos(angle_rad) * THRUST_POWER * dt
+        thrust_y = math.sin(angle_rad) * THRUST_POWER * dt
+        delta_v = math.sqrt(thrust_x**2 + thrust_y**2)
+        vel_x += thrust_x
+        vel_y += thrust_y
+        ship.consume_fuel(dt)
+
+    ship.vel_x = vel_x
+    ship.vel_y = vel_y
+    ship.x += vel_x * dt
+    ship.y += vel_y * dt
+    return delta_v
+
+
 def check_landing(x, y, vel_x, vel_y, pad_x, pad_y, pad_width, pad_height):
     """
     Check if ship has landed on the pad.
@@ -109,6 +155,30 @@ def check_landing(x, y, vel_x, vel_y, pad_x, pad_y, pad_width, pad_height):
     return result
 
 
+def landing_status(x, y, vel_x, vel_y, pad):
+    """
+    Check if ship has landed on the pad (same rules as check_landing,
+    answered with a code instead of a new dictionary).
+
+    Args:
+        x, y: Ship position (center of ship)
+        vel_x, vel_y: Ship velocity
+        pad: level.PadInfo of the landing pad
+
+    Returns:
+        LANDING_FLYING, LANDING_LANDED, LANDING_CRASHED, or LANDING_MISSED
+    """
+    if y < pad.y:
+        return LANDING_FLYING
+
+    if not pad.x <= x <= pad.x + pad.width:
+        return LANDING_MISSED
+
+    if math.sqrt(vel_x**2 + vel_y**2) <= MAX_LANDING_VELOCITY:
+        return LANDING_LANDED
+    return LANDING_CRASHED
+
+
 def get_speed(vel_x, vel_y):
     """Calculate total speed from velocity components."""
     return math.sqrt(vel_x**2 + vel_y**2)
@@ -134,12 +204,105 @@ def check_terrain_collision(x, y, terrain_height_func, ship_margin=None):
     if ship_margin is None:
         ship_margin = SHIP_SIZE
 
-    # Check collision at ship center and slightly to each side
-    check_points = [x - ship_margin, x, x + ship_margin]
+    # Check collision slightly to the left, at ship center, and to the right
+    return (y >= terrain_height_func(x - ship_margin)
+            or y >= terrain_height_func(x)
+            or y >= terrain_height_func(x + ship_margin))
+
 
-    for check_x in check_points:
-        terrain_y = terrain_height_func(check_x)
-        if y >= terrain_y:
-            return True
+def sweep_terrain_collision(x0, y0, x1, y1, terrain_points_func, ship_margin=None):
+    """
+    Check if the ship hit terrain at any point while moving from (x0, y0) to (x1, y1).
+    Unlike check_terrain_collision, a fast ship can't skip over a thin peak.
 
-    return False
+    The ship is tested at the same three points as check_terrain_collision
+    (center and one margin to each side), each swept along the motion.
+
+    Args:
+        x0, y0: Ship position at the start of the step
+        x1, y1: Ship position at the end of the step
+        terrain_points_func: Function(x_min, x_max) returning the terrain
+                             polyline points under that X range (broad phase)
+        ship_margin: Collision buffer around ship center (defaults to SHIP_SIZE)
+
+    Returns:
+        None if there was no collision, otherwise a dictionary:
+        - 'time': Fraction of the step (0.0 to 1.0) at which the ship hit
+        - 'normal': (nx, ny) unit normal of the terrain surface, pointing up
+        - 'point': (x, y) where the ship touched the terrain
+    """
+    if ship_margin is None:
+        ship_margin = SHIP_SIZE
+
+    # Broad phase: only segments under the ship's path
+    points = terrain_points_func(min(x0, x1) - ship_margin, max(x0, x1) + ship_margin)
+
+    move_x = x1 - x0
+    move_y = y1 - y0
+    hit = None
+
+    for offset in (-ship_margin, 0, ship_margin):
+        start_x = x0 + offset
+
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            t = segment_hit_time(start_x, y0, move_x, move_y, ax, ay, bx, by)
+            if t is None:
+                continue
+
+            length = math.sqrt((bx - ax)**2 + (by - ay)**2)
+            normal = ((by - ay) / length, -(bx - ax) / length)
+
+            if t == SEGMENT_UNDER:
+                ground_y = ay + (start_x - ax) / (bx - ax) * (by - ay)
+                return {'time': 0.0, 'normal': normal, 'point': (start_x, ground_y)}
+
+            if hit is None or t < hit['time']:
+                hit = {
+                    'time': t,
+                    'normal': normal,
+                    'point': (start_x + move_x * t, y0 + move_y * t)
+                }
+
+    return hit
+
+
+def segment_hit_time(start_x, start_y, move_x, move_y, ax, ay, bx, by):
+    """
+    Test one point's motion against one terrain segment. This is the narrow
+    phase of both sweep_terrain_collision and level.Terrain.sweep_collision,
+    kept in one place so the two always agree.
+
+    Args:
+        start_x, start_y: Where the point starts
+        move_x, move_y: How far it moves this step
+        ax, ay, bx, by: The segment's left and right ends
+
+    Returns:
+        SEGMENT_UNDER if the point starts on or under the segment, else the
+        fraction of the move (0.0 to 1.0) at which it crosses into the
+        segment, or None if it doesn't
+    """
+    seg_x = bx - ax
+    seg_y = by - ay
+
+    # Already on or under this segment at the start of the step
+    if ax <= start_x <= bx:
+        if start_y >= ay + (start_x - ax) / seg_x * seg_y:
+            return SEGMENT_UNDER
+
+    # Up-facing normal of this segment (y increases downward).
+    # Only motion into the surface counts as a hit.
+    length = math.sqrt(seg_x**2 + seg_y**2)
+    if move_x * (seg_y / length) + move_y * (-seg_x / length) >= 0:
+        return None
+
+    # Solve start + t * move == a + u * seg for t and u
+    denom = move_x * seg_y - move_y * seg_x
+    to_a_x = ax - start_x
+    to_a_y = ay - start_y
+    t = (to_a_x * seg_y - to_a_y * seg_x) / denom
+    u = (to_a_x * move_y - to_a_y * move_x) / denom
+
+    if 0.0 <= t <= 1.0 and 0.0 <= u <= 1.0:
+        return t
+    return None
@@ -0,0 +1,167 @@
+# profiler.py - Per-frame timing of each game loop phase
+# Records how long events, input, update, and each part of drawing take,
+# keeps the last few seconds of frames, and can export them as a trace
+
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from constants import PROFILER_HISTORY
+
+# Returned by span() while the profiler is off, so timing costs next to nothing
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    """Times one named section of a frame (used with 'with')."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler._spans.append((self.name, self.start, time.perf_counter()))
+        return False
+
+
+class FrameProfiler:
+    """
+    Times the phases of each frame into a ring buffer of recent frames.
+
+    Usage:
+        profiler.begin_frame()
+        with profiler.span("update"):
+            game.update()
+        profiler.end_frame()
+
+    While disabled, every call returns right away.
+    """
+
+    def __init__(self, history=PROFILER_HISTORY):
+        """
+        Initialize a profiler (disabled until toggled on).
+
+        Args:
+            history: How many recent frames to keep
+        """
+        self.enabled = False
+        self.frames = deque(maxlen=history)  # (start, end, spans) per frame
+        self._frame_start = None
+        self._spans = []
+
+    def toggle(self):
+        """Turn profiling on or off. Turning it on starts a fresh history."""
+        self.enabled = not self.enabled
+        self._frame_start = None
+        if self.enabled:
+            self.frames.clear()
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self._spans = []
+
+    def end_frame(self):
+        """Mark the end of a frame and store its timings."""
+        if not self.enabled or self._frame_start is None:
+            return
+        self.frames.append((self._frame_start, time.perf_counter(), self._spans))
+        self._frame_start = None
+
+    def span(self, name):
+        """
+        Time a section of the current frame.
+
+        Args:
+            name: Section name (like "update" or "draw.ship")
+
+        Returns:
+            Context manager to wrap the section in
+        """
+        if not self.enabled or self._frame_start is None:
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def durations(self):
+        """
+        Collect the recorded durations.
+
+        Returns:
+            Dictionary mapping "frame" and each section name to a list of
+            durations in seconds (a section's time is summed within a frame)
+        """
+        durations = {'frame': []}
+        for start, end, spans in self.frames:
+            durations['frame'].append(end - start)
+
+            # Spans are stored as they finish, so sort nested ones into start order
+            totals = {}
+            for name, span_start, span_end in sorted(spans, key=lambda span: span[1]):
+                totals[name] = totals.get(name, 0.0) + (span_end - span_start)
+            for name, total in totals.items():
+                durations.setdefault(name, []).append(total)
+        return durations
+
+    def stats(self):
+        """
+        Summarize the recorded frames.
+
+        Returns:
+            List of (name, p50, p95, max) tuples in seconds, frame first,
+            then sections in the order they start
+        """
+        if not self.frames:
+            return []
+
+        summary = []
+        for name, values in self.durations().items():
+            values = sorted(values)
+            summary.append((
+                name,
+                values[len(values) // 2],
+                values[min(len(values) - 1, int(len(values) * 0.95))],
+                values[-1]
+            ))
+        return summary
+
+    def export_chrome_trace(self, path):
+        """
+        Save the recorded frames in Chrome's trace event format.
+        Open the file at chrome://tracing or https://ui.perfetto.dev
+
+        Args:
+            path: File to write
+
+        Returns:
+            Number of events written
+        """
+        events = []
+        origin = self.frames[0][0] if self.frames else 0.0
+
+        def add(name, start, end):
+            events.append({
+                'name': name,
+                'ph': 'X',  # A complete event: start time plus duration
+                'ts': (start - origin) * 1e6,  # Microseconds
+                'dur': (end - start) * 1e6,
+                'pid': 0,
+                'tid': 0
+            })
+
+        for start, end, spans in self.frames:
+            add('frame', start, end)
+            for name, span_start, span_end in spans:
+                add(name, span_start, span_end)
+
+        with open(path, "w") as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(events)
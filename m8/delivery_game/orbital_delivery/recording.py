@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# recording.py - Compact delivery recordings (seed + held controls per step)
+# A delivery is fully determined by its difficulty, its seed, and which
+# controls were held on each physics step, so that's all we store
+#
+# Usage (check that saved recordings still play out the same way):
+#     python main.py --record recordings
+#     python recording.py recordings/*.odr
+
+import argparse
+import struct
+import sys
+import time
+from constants import PHYSICS_TIMESTEP, STATE_DESCENT, STATE_RATING, STATE_GAME_OVER
+from controls import ScriptedInput
+
+# One byte per physics step, one bit per control
+ROTATE_LEFT_BIT = 1   # A
+ROTATE_RIGHT_BIT = 2  # D
+THRUST_BIT = 4        # W
+
+# File header: magic, difficulty, delivery seed, step count,
+# and the outcome (end state, landed, rating) for regression checks
+RECORDING_MAGIC = b"ODR1"
+HEADER = struct.Struct("<4sHIIBBB")
+
+# End states, stored as their index in this list
+END_STATES = [STATE_DESCENT, STATE_RATING, STATE_GAME_OVER]
+
+
+class Recording:
+    """
+    The controls held during one delivery, packed as one byte per physics step.
+    A two-minute delivery takes about 7 KB.
+    """
+
+    def __init__(self, difficulty=1, seed=0, steps=b""):
+        """
+        Initialize a recording.
+
+        Args:
+            difficulty: Difficulty of the recorded delivery
+            seed: GameState.delivery_seed the level and package were built from
+            steps: Packed control bytes recorded so far
+        """
+        self.difficulty = difficulty
+        self.seed = seed
+        self.steps = bytearray(steps)
+
+        # Filled in by finish() when the delivery ends
+        self.state = STATE_DESCENT
+        self.landed = False
+        self.rating = 0
+
+    def __len__(self):
+        return len(self.steps)
+
+    def record(self, rotate_left, rotate_right, thrust):
+        """Add the controls held for one physics step."""
+        self.steps.append((ROTATE_LEFT_BIT if rotate_left else 0)
+                          | (ROTATE_RIGHT_BIT if rotate_right else 0)
+                          | (THRUST_BIT if thrust else 0))
+
+    def finish(self, state, landed, rating):
+        """Remember how the delivery ended, to check replays against."""
+        self.state = state
+        self.landed = landed
+        self.rating = rating
+
+    def controls(self):
+        """Yield (rotate_left, rotate_right, thrust) for each recorded step."""
+        for step in self.steps:
+            yield (bool(step & ROTATE_LEFT_BIT), bool(step & ROTATE_RIGHT_BIT),
+                   bool(step & THRUST_BIT))
+
+    def to_bytes(self):
+        """Pack the recording into bytes (header, then one byte per step)."""
+        header = HEADER.pack(RECORDING_MAGIC, self.difficulty, self.seed, len(self.steps),
+                             END_STATES.index(self.state), self.landed, self.rating)
+        return header + bytes(self.steps)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Unpack a recording made by to_bytes().
+
+        Raises:
+            ValueError: If the data isn't a recording
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Not a delivery recording (too short)")
+        magic, difficulty, seed, count, state, landed, rating = HEADER.unpack_from(data)
+        if magic != RECORDING_MAGIC:
+            raise ValueError("Not a delivery recording")
+
+        steps = data[HEADER.size:]
+        if len(steps) != count:
+            raise ValueError(f"Recording has {len(steps)} steps, expected {count}")
+
+        recording = cls(difficulty, seed, steps)
+        recording.finish(END_STATES[state], bool(landed), rating)
+        return recording
+
+    def save(self, path):
+        """Write the recording to a file."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording from a file."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def replay(recording):
+    """
+    Fly a recorded delivery again, headless and as fast as possible.
+
+    Args:
+        recording: Recording to play back
+
+    Returns:
+        Outcome dictionary (see simulation.simulate_delivery)
+    """
+    # Imported here so recording.py itself doesn't pull in the whole game
+    from game_state import GameState
+    from simulation import delivery_result
+
+    game = GameState(controller=ScriptedInput(recording.controls()))
+    game.difficulty = recording.difficulty
+    game.new_delivery(seed=recording.seed)
+    game.state = STATE_DESCENT
+
+    frames = 0
+    while game.state == STATE_DESCENT and frames < len(recording):
+        game.handle_input()
+        game.update()
+        frames += 1
+
+    return delivery_result(game, frames)
+
+
+def check_replay(recording):
+    """
+    Replay a recording and compare the outcome with the recorded one.
+
+    Returns:
+        Tuple of (matches, replay outcome dictionary)
+    """
+    result = replay(recording)
+    matches = (result['state'] == recording.state
+               and result['landed'] == recording.landed
+               and result['rating'] == recording.rating)
+    return matches, result
+
+
+def main():
+    """Replay recordings and report any whose outcome has changed."""
+    parser = argparse.ArgumentParser(description="Replay delivery recordings")
+    parser.add_argument("paths", nargs="+", help="recording files (.odr)")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.paths:
+        recording = Recording.load(path)
+
+        start = time.perf_counter()
+        matches, result = check_replay(recording)
+        elapsed = time.perf_counter() - start
+        speed = len(recording) * PHYSICS_TIMESTEP / max(elapsed, 1e-9)
+
+        print(f"{'ok' if matches else 'CHANGED':<8}{path}: {result['state']}, "
+              f"{result['rating']} stars, {len(recording)} steps, "
+              f"{speed:.0f}x real time")
+        if not matches:
+            failures += 1
+            print(f"        recorded: {recording.state}, landed={recording.landed}, "
+                  f"{recording.rating} stars")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
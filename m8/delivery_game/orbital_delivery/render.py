@@ -0,0 +1,334 @@
+# render.py - Drawing the world: stars, terrain, landing pad, and ship
+# Kept apart from level.py and ship.py, so the simulation itself never
+# needs pygame (the HUD and menus are in ui.py)
+
+import pygame
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, ROTATION_SPEED,
+    SHIP_SPRITE_SUPERSAMPLE, SHIP_FLAME_VARIANTS,
+    GREEN, GRAY, DARK_GRAY, WHITE, BLACK, ORANGE, YELLOW, RED
+)
+from ship import Ship, ROTATION_STEPS
+
+
+# =============================================================================
+# LEVEL
+# =============================================================================
+
+def draw_landing_pad(surface, pad, camera_x=0):
+    """
+    Draw the landing pad.
+
+    Args:
+        surface: Pygame surface to draw on
+        pad: level.LandingPad to draw
+        camera_x: World X coordinate of the screen's left edge
+    """
+    # Main pad surface
+    x = pad.x - camera_x
+    pad_rect = pygame.Rect(x, pad.y, pad.width, pad.height)
+    pygame.draw.rect(surface, GREEN, pad_rect)
+
+    # Pad border/markings
+    pygame.draw.rect(surface, WHITE, pad_rect, 2)
+
+    # Landing lights (small circles on each end)
+    light_radius = 4
+    pygame.draw.circle(surface, WHITE,
+                       (x + light_radius + 2, pad.y + pad.height // 2),
+                       light_radius)
+    pygame.draw.circle(surface, WHITE,
+                       (x + pad.width - light_radius - 2, pad.y + pad.height // 2),
+                       light_radius)
+
+
+def draw_terrain(surface, terrain, camera_x=0):
+    """
+    Draw the terrain that's on screen (only those chunks get generated).
+
+    Args:
+        surface: Pygame surface to draw on
+        terrain: level.Terrain to draw
+        camera_x: World X coordinate of the screen's left edge
+    """
+    for index in terrain.chunks_between(camera_x, camera_x + SCREEN_WIDTH):
+        points = [(x - camera_x, y) for x, y in terrain.get_chunk(index).points]
+
+        # Draw filled ground
+        ground_points = points + [
+            (points[-1][0], SCREEN_HEIGHT),
+            (points[0][0], SCREEN_HEIGHT)
+        ]
+        pygame.draw.polygon(surface, DARK_GRAY, ground_points)
+
+        # Draw terrain surface line
+        pygame.draw.lines(surface, GRAY, False, points, 2)
+
+
+def draw_level(surface, level, camera_x=0):
+    """
+    Draw the part of a level that's on screen.
+
+    Args:
+        surface: Pygame surface to draw on
+        level: level.Level to draw
+        camera_x: World X coordinate of the screen's left edge
+    """
+    draw_terrain(surface, level.terrain, camera_x)
+    draw_landing_pad(surface, level.landing_pad, camera_x)
+
+
+def draw_star_field(surface, star_field):
+    """Draw the star field."""
+    for x, y, brightness, size in star_field.stars:
+        color = (brightness, brightness, brightness)
+        if size == 1:
+            surface.set_at((x, y), color)
+        else:
+            pygame.draw.circle(surface, color, (x, y), size)
+
+
+class BackgroundLayer:
+    """
+    Pre-rendered star field and level.
+    Nothing here moves while the view holds still, so it is drawn into a
+    cached surface and then copied to the screen with a single blit per
+    frame. The stars stay put when the view scrolls (they're far away),
+    so only the level is drawn again then.
+    """
+
+    def __init__(self, star_field):
+        """
+        Initialize the background layer.
+
+        Args:
+            star_field: StarField to draw behind everything
+        """
+        self.star_field = star_field
+        self.level = None
+        self.camera_x = 0
+        self._stars = None
+        self._surface = None
+
+    def set_level(self, level, camera_x=0):
+        """
+        Switch to a new level and rebuild the cached image.
+
+        Args:
+            level: Level to draw, or None for stars only
+            camera_x: World X coordinate of the screen's left edge
+        """
+        self.level = level
+        self.camera_x = camera_x
+        self._surface = None
+        self.render()
+
+    def scroll_to(self, camera_x):
+        """
+        Move the view, redrawing the cached image if it changed.
+
+        Args:
+            camera_x: World X coordinate of the screen's left edge
+        """
+        if camera_x != self.camera_x or self._surface is None:
+            self.camera_x = camera_x
+            self.render()
+
+    def _new_surface(self):
+        """A screen-sized surface in the display's pixel format (fast to blit)."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def render(self):
+        """Draw the stars and the visible part of the level into the cached surface."""
+        if self._stars is None:
+            self._stars = self._new_surface()
+            self._stars.fill(BLACK)
+            draw_star_field(self._stars, self.star_field)
+
+        if self._surface is None:
+            self._surface = self._new_surface()
+
+        self._surface.blit(self._stars, (0, 0))
+        if self.level:
+            draw_level(self._surface, self.level, self.camera_x)
+
+    def draw(self, surface):
+        """Copy the cached background onto the surface."""
+        if self._surface is None:
+            self.render()
+        surface.blit(self._surface, (0, 0))
+
+    def restore(self, surface, rects):
+        """
+        Copy just some areas of the cached background onto the surface,
+        erasing whatever was drawn there last frame.
+
+        Args:
+            surface: Surface to restore
+            rects: pygame.Rects to restore
+        """
+        if self._surface is None:
+            self.render()
+        for rect in rects:
+            surface.blit(self._surface, rect, rect)
+
+
+# =============================================================================
+# SHIP
+# =============================================================================
+
+def draw_ship(surface, ship, alpha=1.0, camera_x=0):
+    """
+    Draw a ship with one blit of a pre-drawn sprite.
+
+    Args:
+        surface: Pygame surface to draw on
+        ship: Ship to draw
+        alpha: How far between the last two physics steps to draw the ship
+        camera_x: World X coordinate of the screen's left edge
+
+    Returns:
+        pygame.Rect covering everything drawn (for dirty-rect updates)
+    """
+    x, y, angle = ship.get_render_pose(alpha)
+    x -= camera_x
+    if not ROTATION_STEPS:
+        return draw_ship_polygons(surface, ship, (x, y, angle))
+
+    # Nearest rotation step, and a random flame for the flicker
+    step = round(angle / ROTATION_SPEED) % ROTATION_STEPS
+    flame = None
+    if ship.thrusting and ship.fuel > 0:
+        flame = (ship.rng.randrange(SHIP_FLAME_VARIANTS), ship.rng.random() > 0.3)
+
+    sprite, offset_x, offset_y = ship_sprites.get(ship.size, step, flame)
+    # Sprite colors are premultiplied by alpha (see ShipSprites)
+    return surface.blit(sprite, (round(x) + offset_x, round(y) + offset_y),
+                        special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def draw_ship_polygons(surface, ship, pose=None):
+    """
+    Draw a ship as plain polygons, without sprites (used when the
+    rotation steps don't divide evenly into a full turn).
+
+    Args:
+        surface: Pygame surface to draw on
+        ship: Ship to draw
+        pose: Optional (x, y, angle) to use instead of the ship's current pose
+
+    Returns:
+        pygame.Rect covering everything drawn
+    """
+    # Draw ship body (triangle)
+    ship_points = ship.get_triangle_points(pose)
+    area = pygame.draw.polygon(surface, WHITE, ship_points)
+    area.union_ip(pygame.draw.polygon(surface, WHITE, ship_points, 2))
+
+    # Draw thrust flame if thrusting
+    if ship.thrusting and ship.fuel > 0:
+        flame_points = ship.get_flame_points(pose)
+        # Inner flame (yellow)
+        area.union_ip(pygame.draw.polygon(surface, YELLOW, flame_points))
+        # Outer glow effect - slightly larger orange flame
+        if ship.rng.random() > 0.3:  # Flicker
+            area.union_ip(pygame.draw.polygon(surface, ORANGE, flame_points, 2))
+
+    return area
+
+
+def draw_crashed_ship(surface, ship, camera_x=0):
+    """
+    Draw a crashed/destroyed ship.
+
+    Args:
+        surface: Pygame surface to draw on
+        ship: Ship to draw
+        camera_x: World X coordinate of the screen's left edge
+    """
+    x = ship.x - camera_x
+    for offset_x, offset_y, size in ship.get_debris():
+        points = [
+            (x + offset_x, ship.y + offset_y),
+            (x + offset_x + size, ship.y + offset_y + size),
+            (x + offset_x - size, ship.y + offset_y + size)
+        ]
+        pygame.draw.polygon(surface, RED, points)
+
+
+class ShipSprites:
+    """
+    Pre-drawn, smooth-edged ship sprites for every rotation step, with and
+    without each flame variant. A sprite is drawn the first time it's
+    needed and then reused, so drawing a ship is a single blit.
+    """
+
+    def __init__(self):
+        """Initialize an empty sprite cache."""
+        self._sprites = {}
+
+    def get(self, size, step, flame=None):
+        """
+        Get the sprite for a ship.
+
+        Args:
+            size: Ship size (see Ship.size)
+            step: Rotation step, 0 to ROTATION_STEPS - 1
+            flame: None for no flame, or (variant, glow) where variant picks
+                   the flame length and glow adds the orange outline
+
+        Returns:
+            Tuple of (surface, offset_x, offset_y): a surface with
+            premultiplied alpha, and where its top-left corner goes
+            relative to the ship's position
+        """
+        key = (size, step, flame)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(size, step, flame)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render(self, size, step, flame):
+        """Draw one sprite large, then shrink it down for smooth edges."""
+        scale = SHIP_SPRITE_SUPERSAMPLE
+
+        # Big enough for the longest flame plus its outline, on every side
+        half = int(size * 1.7) + 3
+        big = pygame.Surface((2 * half * scale, 2 * half * scale), pygame.SRCALPHA)
+        big.fill((0, 0, 0, 0))
+
+        model = Ship(half * scale, half * scale)
+        model.size = size * scale
+        model.angle = step * ROTATION_SPEED
+
+        ship_points = model.get_triangle_points()
+        pygame.draw.polygon(big, WHITE, ship_points)
+        pygame.draw.polygon(big, WHITE, ship_points, 2 * scale)
+
+        if flame is not None:
+            variant, glow = flame
+            spread = variant / max(1, SHIP_FLAME_VARIANTS - 1)
+            flame_points = model.get_flame_points(
+                flame_length=model.size * (0.8 + spread * 0.4))
+            pygame.draw.polygon(big, YELLOW, flame_points)
+            if glow:
+                pygame.draw.polygon(big, ORANGE, flame_points, 2 * scale)
+
+        # Averaging with the transparent (0, 0, 0, 0) background leaves each
+        # edge pixel's color premultiplied by how much of it was covered
+        sprite = pygame.transform.smoothscale(big, (2 * half, 2 * half))
+
+        # Trim the empty border - fewer pixels to blit every frame
+        used = sprite.get_bounding_rect()
+        sprite = sprite.subsurface(used).copy()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, used.x - half, used.y - half
+
+
+# Shared by every ship
+ship_sprites = ShipSprites()
@@ -1,22 +1,91 @@
-# ship.py - Ship state and rendering
+# ship.py - Ship state and geometry (drawn by render.py)
 
 import math
-import pygame
+import random
+import struct
 from constants import (
     SHIP_START_X, SHIP_START_Y, SHIP_SIZE,
-    STARTING_FUEL, FUEL_BURN_RATE, ROTATION_SPEED,
-    WHITE, ORANGE, YELLOW, RED
+    STARTING_FUEL, FUEL_BURN_RATE, ROTATION_SPEED
 )
 
+WING_ANGLE = 140  # Degrees from the nose to each wing tip
+
+# Ship.snapshot() layout: x, y, vel_x, vel_y, angle, fuel, prev_x, prev_y,
+# prev_angle as doubles, then thrusting (73 bytes)
+SHIP_STATE = struct.Struct("<9d?")
+
+
+def _orientation(angle):
+    """
+    Work out the sines and cosines needed to draw the ship at an angle.
+
+    Args:
+        angle: Ship angle in degrees
+
+    Returns:
+        Tuple of (sin, cos) for the nose direction, then the left wing,
+        then the right wing: (sin_a, cos_a, sin_l, cos_l, sin_r, cos_r)
+    """
+    angle_rad = math.radians(angle)
+    left_angle = angle_rad + math.radians(WING_ANGLE)
+    right_angle = angle_rad - math.radians(WING_ANGLE)
+    return (
+        math.sin(angle_rad), math.cos(angle_rad),
+        math.sin(left_angle), math.cos(left_angle),
+        math.sin(right_angle), math.cos(right_angle)
+    )
+
+
+# The ship turns ROTATION_SPEED degrees at a time, so it almost always faces
+# one of a few angles (120 at 3 degrees). Work those out once, up front.
+# (If ROTATION_SPEED doesn't divide 360, every angle is worked out on the fly.)
+ROTATION_STEPS = int(360 / ROTATION_SPEED) if (360 / ROTATION_SPEED).is_integer() else 0
+ORIENTATIONS = [_orientation(i * ROTATION_SPEED) for i in range(ROTATION_STEPS)]
+
+
+def get_orientation(angle):
+    """
+    Look up the sines and cosines for a ship angle (see _orientation).
+    Angles between rotation steps (like mid-step render poses) are
+    calculated instead.
+
+    Args:
+        angle: Ship angle in degrees
+
+    Returns:
+        Tuple of (sin_a, cos_a, sin_l, cos_l, sin_r, cos_r)
+    """
+    step = angle / ROTATION_SPEED
+    if ROTATION_STEPS and step.is_integer():
+        return ORIENTATIONS[int(step) % ROTATION_STEPS]
+    return _orientation(angle)
+
 
 class Ship:
     """
     Represents the delivery ship with position, velocity, fuel, and angle.
-    Handles rendering and state management.
+    Handles state and the geometry render.py draws it from.
+
+    Attributes live in __slots__ (no per-ship dictionary), and snapshot()
+    packs the physics state into a few bytes, so copying a ship's state
+    for a search or a rewind is cheap.
     """
 
-    def __init__(self, x=SHIP_START_X, y=SHIP_START_Y):
-        """Initialize ship at starting position."""
+    __slots__ = ("rng", "x", "y", "vel_x", "vel_y", "angle", "fuel", "thrusting",
+                 "size", "_debris", "prev_x", "prev_y", "prev_angle")
+
+    def __init__(self, x=SHIP_START_X, y=SHIP_START_Y, rng=None):
+        """
+        Initialize ship at starting position.
+
+        Args:
+            x, y: Starting position
+            rng: random.Random for purely cosmetic effects (flame flicker,
+                 crash debris), kept apart from the gameplay random stream
+                 so drawing never changes what happens (defaults to the
+                 random module)
+        """
+        self.rng = rng or random
         self.x = x
         self.y = y
         self.vel_x = 0.0
@@ -27,6 +96,11 @@ class Ship:
         self.size = SHIP_SIZE
         self._debris = None  # Cached debris positions for crash rendering
 
+        # Pose at the previous physics step, for render interpolation
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_angle = 0.0
+
     def reset(self, x=SHIP_START_X, y=SHIP_START_Y):
         """Reset ship to starting state."""
         self.x = x
@@ -37,119 +111,155 @@ class Ship:
         self.fuel = STARTING_FUEL
         self.thrusting = False
         self._debris = None  # Clear cached debris
+        self.save_previous()
+
+    def save_previous(self):
+        """Remember the current pose before a physics step moves the ship."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_angle = self.angle
 
-    def rotate_left(self):
+    def snapshot(self):
+        """
+        Pack the ship's physics state (pose, velocity, fuel, thrusting, and
+        the previous pose) into bytes, for restore() to bring back.
+
+        Returns:
+            SHIP_STATE.size bytes
+        """
+        return SHIP_STATE.pack(self.x, self.y, self.vel_x, self.vel_y, self.angle,
+                               self.fuel, self.prev_x, self.prev_y, self.prev_angle,
+                               self.thrusting)
+
+    def restore(self, state, offset=0):
+        """
+        Put the ship back the way a snapshot() found it. Crash debris is
+        forgotten, as after reset().
+
+        Args:
+            state: Bytes from snapshot(), or a buffer holding many of them
+            offset: Where in the buffer this ship's snapshot starts
+        """
+        (self.x, self.y, self.vel_x, self.vel_y, self.angle, self.fuel,
+         self.prev_x, self.prev_y, self.prev_angle,
+         self.thrusting) = SHIP_STATE.unpack_from(state, offset)
+        self._debris = None
+
+    def get_render_pose(self, alpha=1.0):
+        """
+        Blend the previous and current pose for smooth drawing.
+
+        Args:
+            alpha: 0.0 = previous physics step, 1.0 = current physics step
+
+        Returns:
+            Tuple of (x, y, angle)
+        """
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+            self.prev_angle + (self.angle - self.prev_angle) * alpha
+        )
+
+    def rotate_left(self, dt=1.0):
         """Rotate counter-clockwise."""
-        self.angle -= ROTATION_SPEED
+        self.angle -= ROTATION_SPEED * dt
 
-    def rotate_right(self):
+    def rotate_right(self, dt=1.0):
         """Rotate clockwise."""
-        self.angle += ROTATION_SPEED
+        self.angle += ROTATION_SPEED * dt
 
     def can_thrust(self):
         """Check if ship has fuel to thrust."""
         return self.fuel > 0
 
-    def consume_fuel(self):
+    def consume_fuel(self, dt=1.0):
         """Consume fuel when thrusting."""
         if self.fuel > 0:
-            self.fuel = max(0, self.fuel - FUEL_BURN_RATE)
+            self.fuel = max(0, self.fuel - FUEL_BURN_RATE * dt)
             return True
         return False
 
-    def get_triangle_points(self):
+    def get_triangle_points(self, pose=None):
         """
         Calculate the three points of the ship triangle based on position and angle.
-        Returns list of (x, y) tuples for the triangle vertices.
+
+        Args:
+            pose: Optional (x, y, angle) to use instead of the current pose
+
+        Returns:
+            List of (x, y) tuples for the triangle vertices.
         """
-        angle_rad = math.radians(self.angle)
+        x, y, angle = pose if pose is not None else (self.x, self.y, self.angle)
+        sin_a, cos_a, sin_l, cos_l, sin_r, cos_r = get_orientation(angle)
 
         # Ship is a triangle pointing in the direction of angle
         # Nose (front)
-        nose_x = self.x + math.sin(angle_rad) * self.size
-        nose_y = self.y - math.cos(angle_rad) * self.size
+        nose_x = x + sin_a * self.size
+        nose_y = y - cos_a * self.size
 
         # Left wing
-        left_angle = angle_rad + math.radians(140)
-        left_x = self.x + math.sin(left_angle) * (self.size * 0.7)
-        left_y = self.y - math.cos(left_angle) * (self.size * 0.7)
+        wing = self.size * 0.7
+        left_x = x + sin_l * wing
+        left_y = y - cos_l * wing
 
         # Right wing
-        right_angle = angle_rad - math.radians(140)
-        right_x = self.x + math.sin(right_angle) * (self.size * 0.7)
-        right_y = self.y - math.cos(right_angle) * (self.size * 0.7)
+        right_x = x + sin_r * wing
+        right_y = y - cos_r * wing
 
         return [(nose_x, nose_y), (left_x, left_y), (right_x, right_y)]
 
-    def get_flame_points(self):
+    def get_flame_points(self, pose=None, flame_length=None):
         """
         Calculate points for the thrust flame triangle.
-        Returns list of (x, y) tuples for the flame vertices.
+
+        Args:
+            pose: Optional (x, y, angle) to use instead of the current pose
+            flame_length: Optional length past the flame base (random flicker if None)
+
+        Returns:
+            List of (x, y) tuples for the flame vertices.
         """
-        angle_rad = math.radians(self.angle)
+        x, y, angle = pose if pose is not None else (self.x, self.y, self.angle)
+        sin_a, cos_a = get_orientation(angle)[:2]
 
         # Flame comes out the back of the ship
         # Base of flame (between the wings)
         back_offset = self.size * 0.5
 
         # Center of flame base
-        base_x = self.x - math.sin(angle_rad) * back_offset
-        base_y = self.y + math.cos(angle_rad) * back_offset
+        base_x = x - sin_a * back_offset
+        base_y = y + cos_a * back_offset
 
         # Flame tip (extends further back)
-        import random
-        flame_length = self.size * (0.8 + random.random() * 0.4)  # Flicker effect
-        tip_x = self.x - math.sin(angle_rad) * (back_offset + flame_length)
-        tip_y = self.y + math.cos(angle_rad) * (back_offset + flame_length)
+        if flame_length is None:
+            flame_length = self.size * (0.8 + self.rng.random() * 0.4)  # Flicker effect
+        tip_x = x - sin_a * (back_offset + flame_length)
+        tip_y = y + cos_a * (back_offset + flame_length)
 
         # Flame base width
         base_width = self.size * 0.3
-        left_x = base_x + math.cos(angle_rad) * base_width
-        left_y = base_y + math.sin(angle_rad) * base_width
-        right_x = base_x - math.cos(angle_rad) * base_width
-        right_y = base_y - math.sin(angle_rad) * base_width
+        left_x = base_x + cos_a * base_width
+        left_y = base_y + sin_a * base_width
+        right_x = base_x - cos_a * base_width
+        right_y = base_y - sin_a * base_width
 
         return [(left_x, left_y), (right_x, right_y), (tip_x, tip_y)]
 
-    def draw(self, surface):
+    def get_debris(self):
         """
-        Draw the ship on the given surface.
+        Get the pieces a crashed ship broke into. They're picked at random
+        the first time, then stay put until the ship is reset.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            List of (offset_x, offset_y, size) for each piece, relative
+            to the ship's position
         """
-        # Draw ship body (triangle)
-        ship_points = self.get_triangle_points()
-        pygame.draw.polygon(surface, WHITE, ship_points)
-        pygame.draw.polygon(surface, WHITE, ship_points, 2)
-
-        # Draw thrust flame if thrusting
-        if self.thrusting and self.fuel > 0:
-            flame_points = self.get_flame_points()
-            # Inner flame (yellow)
-            pygame.draw.polygon(surface, YELLOW, flame_points)
-            # Outer glow effect - slightly larger orange flame
-            import random
-            if random.random() > 0.3:  # Flicker
-                pygame.draw.polygon(surface, ORANGE, flame_points, 2)
-
-    def draw_crashed(self, surface):
-        """Draw a crashed/destroyed ship."""
-        # Generate debris once and cache it
         if self._debris is None:
-            import random
             self._debris = []
             for _ in range(4):
-                offset_x = random.randint(-20, 20)
-                offset_y = random.randint(-10, 10)
-                size = random.randint(3, 8)
+                offset_x = self.rng.randint(-20, 20)
+                offset_y = self.rng.randint(-10, 10)
+                size = self.rng.randint(3, 8)
                 self._debris.append((offset_x, offset_y, size))
-
-        # Draw cached debris triangles
-        for offset_x, offset_y, size in self._debris:
-            points = [
-                (self.x + offset_x, self.y + offset_y),
-                (self.x + offset_x + size, self.y + offset_y + size),
-                (self.x + offset_x - size, self.y + offset_y + size)
-            ]
-            pygame.draw.polygon(surface, RED, points)
+        return self._debris
@@ -0,0 +1,79 @@
+# simulation.py - Headless deliveries for batch-testing levels
+# Runs the real GameState.update() logic with no window, no drawing, and no frame cap
+# (and without importing pygame, so worker processes start quickly)
+
+from constants import PHYSICS_HZ, STATE_DESCENT
+from controls import ScriptedInput
+from game_state import GameState
+
+# Give up on a delivery after this many physics steps (two minutes of game time)
+MAX_SIMULATION_FRAMES = PHYSICS_HZ * 120
+
+
+def simulate_delivery(difficulty=1, inputs=(), max_frames=MAX_SIMULATION_FRAMES,
+                      controller=None, seed=None, setup=None):
+    """
+    Fly one delivery from the start of descent until it ends.
+
+    Args:
+        difficulty: Level difficulty (1+)
+        inputs: Iterable of (rotate_left, rotate_right, thrust) tuples, one
+                per physics step. Once it runs out, no controls are held.
+        max_frames: Stop after this many frames even if still flying
+        controller: controls.Controller (like autopilot.Autopilot) to fly
+                    with instead of the scripted inputs
+        seed: Seed for the level and package (see GameState); None for a random one
+        setup: Optional function(game) to call once the delivery is set up,
+               just before the descent starts (like calibrate.py nudging
+               where the ship starts)
+
+    Returns:
+        Dictionary describing the outcome:
+        - 'state': Final game state (rating, game_over, or descent if timed out)
+        - 'landed': Boolean, whether the ship landed on the pad
+        - 'rating': Package star rating (1-5)
+        - 'frames': Number of physics steps simulated
+        - 'fuel': Fuel remaining
+        - 'delivery_time': Seconds of game time
+        - 'total_delta_v': Acceleration the package experienced
+        - 'package_type': "fragile" or "urgent"
+        - 'seed': Seed of the delivery, for rebuilding its level and package
+    """
+    game = GameState(controller=controller or ScriptedInput(inputs), seed=seed)
+    game.difficulty = difficulty
+    game.new_delivery()
+    if setup:
+        setup(game)
+    game.state = STATE_DESCENT
+
+    frames = 0
+    while game.state == STATE_DESCENT and frames < max_frames:
+        game.handle_input()
+        game.update()
+        frames += 1
+
+    return delivery_result(game, frames)
+
+
+def delivery_result(game, frames):
+    """
+    Summarize how a simulated delivery ended.
+
+    Args:
+        game: The GameState that was flown
+        frames: Number of physics steps simulated
+
+    Returns:
+        Outcome dictionary (see simulate_delivery)
+    """
+    return {
+        'state': game.state,
+        'landed': game.landed_successfully,
+        'rating': game.package.calculate_rating(),
+        'frames': frames,
+        'fuel': game.ship.fuel,
+        'delivery_time': game.package.delivery_time,
+        'total_delta_v': game.package.total_delta_v,
+        'package_type': game.package.package_type,
+        'seed': game.delivery_seed
+    }
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Startup report - how long the game takes from launch to its first frame,
+which imports that time goes to, and how quickly a simulation worker starts.
+
+Each run starts a fresh Python process, like a player launching the game,
+which builds the Game, draws the title screen once and reports back. The
+median over several runs is checked against FIRST_FRAME_BUDGET.
+
+Worker processes (like calibrate.py's) only import the simulation, which
+must not pull in pygame - that alone costs more than the rest put together.
+
+Usage:
+    python startup.py                          # Report, exit 1 if over budget
+    python startup.py --runs 10 --budget 0.5
+    SDL_VIDEODRIVER=dummy python startup.py    # Without opening any windows
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from constants import FIRST_FRAME_BUDGET
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Runs in the fresh process: time each step up to the first title frame
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import pygame
+pygame_imported = time.perf_counter()
+import main
+game_imported = time.perf_counter()
+game = main.Game()
+created = time.perf_counter()
+game.draw()
+drawn = time.perf_counter()
+print(pygame_imported - start, game_imported - pygame_imported,
+      created - game_imported, drawn - created, flush=True)
+pygame.quit()
+"""
+
+# What FIRST_FRAME_SCRIPT prints, in order
+SCRIPT_PHASES = ["import pygame", "import game", "Game()", "first draw"]
+
+# Runs in the fresh process: what a simulation worker imports before its first delivery
+WORKER_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import simulation, autopilot
+print(time.perf_counter() - start, 'pygame' in sys.modules, flush=True)
+"""
+
+
+def measure_first_frame():
+    """
+    Launch the game in a fresh process and time it to the first title frame.
+
+    Returns:
+        Dictionary of seconds for each phase: 'python start' (the
+        interpreter itself), then SCRIPT_PHASES, then 'total'
+    """
+    # Skip pygame's greeting so the first line printed is ours
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=GAME_DIR,
+                             env=env, stdout=subprocess.PIPE, text=True)
+    line = child.stdout.readline()
+    total = time.perf_counter() - start
+    child.communicate()
+
+    if not line:
+        raise RuntimeError("The game exited before drawing its first frame")
+
+    phases = dict(zip(SCRIPT_PHASES, (float(value) for value in line.split())))
+    return {'python start': total - sum(phases.values()), **phases, 'total': total}
+
+
+def measure_worker_start():
+    """
+    Time a simulation worker's imports in a fresh process.
+
+    Returns:
+        Tuple of (seconds, whether pygame got imported)
+    """
+    result = subprocess.run([sys.executable, "-c", WORKER_SCRIPT], cwd=GAME_DIR,
+                            capture_output=True, text=True, check=True)
+    seconds, pygame_imported = result.stdout.split()
+    return float(seconds), pygame_imported == "True"
+
+
+def measure_imports():
+    """
+    Time the imports main.py makes, using Python's -X importtime.
+    A module is only counted where it's first imported, so a module that
+    pygame already imported costs nothing when the game imports it again.
+
+    Returns:
+        List of (module, seconds including what it imports), slowest first
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=GAME_DIR, capture_output=True, text=True,
+                            env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"))
+
+    # Each line is "import time: self [us] | cumulative | <two spaces per level>name",
+    # and a module's own imports are listed just before it
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == "main":
+                imports.append(("main (all)", int(cumulative) / 1e6))
+                break
+            imports = []  # Part of Python's own startup, not the game's
+        elif depth == 1:
+            imports.append((name.strip(), int(cumulative) / 1e6))
+
+    return sorted(imports, key=lambda item: item[1], reverse=True)
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Time the game's startup")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="launches to take the median of")
+    parser.add_argument("--budget", type=float, default=FIRST_FRAME_BUDGET,
+                        help="most seconds allowed from launch to the first frame")
+    parser.add_argument("--top", type=int, default=10,
+                        help="how many of the slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [measure_first_frame() for _ in range(args.runs)]
+    print(f"Time to first frame (median of {args.runs} runs)")
+    for phase in runs[0]:
+        median = statistics.median(run[phase] for run in runs)
+        print(f"  {phase:<16} {median * 1000:8.1f} ms")
+
+    print("\nSlowest imports (cumulative, where first imported)")
+    for name, seconds in measure_imports()[:args.top]:
+        print(f"  {name:<16} {seconds * 1000:8.1f} ms")
+
+    workers = [measure_worker_start() for _ in range(args.runs)]
+    worker_time = statistics.median(seconds for seconds, _ in workers)
+    print(f"\nSimulation worker imports (median of {args.runs} runs)")
+    print(f"  {'simulation':<16} {worker_time * 1000:8.1f} ms")
+    if any(pygame_imported for _, pygame_imported in workers):
+        print("\nPYGAME IMPORTED: the simulation should run without pygame "
+              "(drawing belongs in render.py or ui.py)")
+        sys.exit(1)
+
+    total = statistics.median(run['total'] for run in runs)
+    if total > args.budget:
+        print(f"\nOVER BUDGET: {total * 1000:.0f} ms to the first frame "
+              f"(budget {args.budget * 1000:.0f} ms)")
+        sys.exit(1)
+    print(f"\nWithin budget: {total * 1000:.0f} ms of {args.budget * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,148 @@
 # ui.py - HUD, menus, and rating display
 
+from collections import OrderedDict
 import pygame
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     WHITE, GREEN, RED, YELLOW, ORANGE, GRAY, BLACK,
-    STARTING_FUEL, MAX_LANDING_VELOCITY
+    STARTING_FUEL, MAX_LANDING_VELOCITY, TEXT_CACHE_SIZE
 )
 
 
+class TextCache:
+    """
+    Remembers rendered text so the same words aren't rendered every frame.
+    Labels like "FUEL" never change, and values like "87%" only change when
+    the number shown changes, so most frames are all cache hits.
+    Least recently used entries are dropped once max_size is reached.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Most rendered surfaces to keep at once
+        """
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Get rendered text, same arguments as font.render().
+
+        Args:
+            font: Pygame font to render with
+            text: String to render
+            antialias: Boolean, smooth edges
+            color: RGB tuple
+
+        Returns:
+            Pygame surface with the text (shared - don't draw on it)
+        """
+        key = (font, text, color, antialias)
+        text_surface = self._surfaces.get(key)
+
+        if text_surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)  # Most recently used
+            return text_surface
+
+        self.misses += 1
+        text_surface = font.render(text, antialias, color)
+        self._surfaces[key] = text_surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)  # Drop least recently used
+        return text_surface
+
+    def clear(self):
+        """Forget all cached text and reset the counters."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class FontRegistry:
+    """
+    Loads each font size once and shares it between every screen.
+    Many screens use the same sizes, and sharing the font objects also
+    lets them share entries in the text cache.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry (fonts load on first use)."""
+        self._fonts = {}
+
+    def get(self, size):
+        """
+        Get the default font at a size, loading it the first time.
+
+        Args:
+            size: Font size in pixels
+
+        Returns:
+            Pygame font (shared - don't change its style)
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+
+class ShadeRegistry:
+    """
+    Makes each translucent black layer (used to dim the game behind a
+    screen) once, instead of a new full-screen surface every frame.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry (layers are made on first use)."""
+        self._shades = {}
+
+    def get(self, size, alpha):
+        """
+        Get a black layer of a size and transparency, making it the first time.
+
+        Args:
+            size: (width, height) in pixels
+            alpha: Opacity, 0 (invisible) to 255 (solid black)
+
+        Returns:
+            Pygame surface (shared - don't draw on it)
+        """
+        key = (size, alpha)
+        shade = self._shades.get(key)
+        if shade is None:
+            shade = pygame.Surface(size)
+            shade.fill(BLACK)
+            shade.set_alpha(alpha)
+            self._shades[key] = shade
+        return shade
+
+
+# Shared by every screen, so identical text is only rendered once
+text_cache = TextCache()
+
+# Shared by every screen, so each font size is only loaded once
+fonts = FontRegistry()
+
+# Shared by every screen, so each dimming layer is only made once
+shades = ShadeRegistry()
+
+
 class HUD:
     """Heads-up display showing fuel, altitude, velocity, and package info."""
 
     def __init__(self):
         """Initialize HUD with fonts."""
-        pygame.font.init()
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_large = pygame.font.Font(None, 48)
+        self.font_small = fonts.get(24)
+        self.font_medium = fonts.get(32)
+        self.font_large = fonts.get(48)
 
     def draw(self, surface, ship, package, altitude):
         """
@@ -27,25 +153,33 @@ class HUD:
             ship: Ship object with fuel, velocity
             package: Current package being delivered
             altitude: Current altitude above ground
+
+        Returns:
+            List of pygame.Rects covering everything drawn (for dirty-rect updates)
         """
         # Left panel - Ship info
-        self._draw_fuel_gauge(surface, ship.fuel, 10, 10)
-        self._draw_velocity(surface, ship.vel_x, ship.vel_y, 10, 70)
-        self._draw_altitude(surface, altitude, 10, 130)
+        rects = [
+            self._draw_fuel_gauge(surface, ship.fuel, 10, 10),
+            self._draw_velocity(surface, ship.vel_x, ship.vel_y, 10, 70),
+            self._draw_altitude(surface, altitude, 10, 130)
+        ]
 
         # Right panel - Package info
-        self._draw_package_info(surface, package, SCREEN_WIDTH - 200, 10)
+        if package is not None:
+            rects.append(self._draw_package_info(surface, package, SCREEN_WIDTH - 200, 10))
+
+        return rects
 
     def _draw_fuel_gauge(self, surface, fuel, x, y):
-        """Draw fuel gauge with bar and text."""
+        """Draw fuel gauge with bar and text. Returns the area drawn."""
         # Label
-        label = self.font_small.render("FUEL", True, WHITE)
-        surface.blit(label, (x, y))
+        label = text_cache.render(self.font_small, "FUEL", True, WHITE)
+        area = surface.blit(label, (x, y))
 
         # Gauge background
         gauge_width = 150
         gauge_height = 20
-        pygame.draw.rect(surface, GRAY, (x, y + 20, gauge_width, gauge_height))
+        area.union_ip(pygame.draw.rect(surface, GRAY, (x, y + 20, gauge_width, gauge_height)))
 
         # Fuel level
         fuel_percent = fuel / STARTING_FUEL
@@ -65,17 +199,18 @@ class HUD:
         pygame.draw.rect(surface, WHITE, (x, y + 20, gauge_width, gauge_height), 2)
 
         # Percentage text
-        pct_text = self.font_small.render(f"{fuel:.0f}%", True, WHITE)
-        surface.blit(pct_text, (x + gauge_width + 10, y + 22))
+        pct_text = text_cache.render(self.font_small, f"{fuel:.0f}%", True, WHITE)
+        area.union_ip(surface.blit(pct_text, (x + gauge_width + 10, y + 22)))
+        return area
 
     def _draw_velocity(self, surface, vel_x, vel_y, x, y):
-        """Draw velocity information."""
+        """Draw velocity information. Returns the area drawn."""
         import math
         speed = math.sqrt(vel_x**2 + vel_y**2)
 
         # Label
-        label = self.font_small.render("VELOCITY", True, WHITE)
-        surface.blit(label, (x, y))
+        label = text_cache.render(self.font_small, "VELOCITY", True, WHITE)
+        area = surface.blit(label, (x, y))
 
         # Color based on landing safety
         if speed < MAX_LANDING_VELOCITY * 0.5:
@@ -86,27 +221,27 @@ class HUD:
             color = RED
 
         # Speed value
-        speed_text = self.font_medium.render(f"{speed:.1f}", True, color)
-        surface.blit(speed_text, (x, y + 18))
+        speed_text = text_cache.render(self.font_medium, f"{speed:.1f}", True, color)
+        area.union_ip(surface.blit(speed_text, (x, y + 18)))
 
         # Direction indicator
-        dir_text = self.font_small.render(f"({vel_x:.1f}, {vel_y:.1f})", True, GRAY)
-        surface.blit(dir_text, (x + 60, y + 22))
+        dir_text = text_cache.render(self.font_small, f"({vel_x:.1f}, {vel_y:.1f})", True, GRAY)
+        area.union_ip(surface.blit(dir_text, (x + 60, y + 22)))
+        return area
 
     def _draw_altitude(self, surface, altitude, x, y):
-        """Draw altitude display."""
+        """Draw altitude display. Returns the area drawn."""
         # Label
-        label = self.font_small.render("ALTITUDE", True, WHITE)
-        surface.blit(label, (x, y))
+        label = text_cache.render(self.font_small, "ALTITUDE", True, WHITE)
+        area = surface.blit(label, (x, y))
 
         # Value
-        alt_text = self.font_medium.render(f"{altitude:.0f}m", True, WHITE)
-        surface.blit(alt_text, (x, y + 18))
+        alt_text = text_cache.render(self.font_medium, f"{altitude:.0f}m", True, WHITE)
+        area.union_ip(surface.blit(alt_text, (x, y + 18)))
+        return area
 
     def _draw_package_info(self, surface, package, x, y):
-        """Draw package information."""
-        if package is None:
-            return
+        """Draw package information. Returns the area drawn."""
 
         # Package type header
         if package.package_type == "fragile":
@@ -116,12 +251,12 @@ class HUD:
             color = YELLOW
             header = "URGENT"
 
-        header_text = self.font_medium.render(header, True, color)
-        surface.blit(header_text, (x, y))
+        header_text = text_cache.render(self.font_medium, header, True, color)
+        area = surface.blit(header_text, (x, y))
 
         # Package name
-        name_text = self.font_small.render(package.name, True, WHITE)
-        surface.blit(name_text, (x, y + 28))
+        name_text = text_cache.render(self.font_small, package.name, True, WHITE)
+        area.union_ip(surface.blit(name_text, (x, y + 28)))
 
         # Relevant metric
         if package.package_type == "fragile":
@@ -129,8 +264,9 @@ class HUD:
         else:
             metric = f"Time: {package.delivery_time:.1f}s"
 
-        metric_text = self.font_small.render(metric, True, GRAY)
-        surface.blit(metric_text, (x, y + 50))
+        metric_text = text_cache.render(self.font_small, metric, True, GRAY)
+        area.union_ip(surface.blit(metric_text, (x, y + 50)))
+        return area
 
 
 class MenuScreen:
@@ -138,22 +274,21 @@ class MenuScreen:
 
     def __init__(self):
         """Initialize menu fonts."""
-        pygame.font.init()
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_instruction = pygame.font.Font(None, 24)
+        self.font_title = fonts.get(64)
+        self.font_subtitle = fonts.get(32)
+        self.font_instruction = fonts.get(24)
 
     def draw_title(self, surface):
         """Draw the title screen."""
         surface.fill(BLACK)
 
         # Title
-        title = self.font_title.render("ORBITAL DELIVERY", True, WHITE)
+        title = text_cache.render(self.font_title, "ORBITAL DELIVERY", True, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         surface.blit(title, title_rect)
 
         # Subtitle
-        subtitle = self.font_subtitle.render("AI Package Delivery Service", True, GRAY)
+        subtitle = text_cache.render(self.font_subtitle, "AI Package Delivery Service", True, GRAY)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
         surface.blit(subtitle, subtitle_rect)
 
@@ -173,11 +308,11 @@ class MenuScreen:
         y_offset = 280
         for line in instructions:
             if line.startswith("Controls"):
-                text = self.font_subtitle.render(line, True, YELLOW)
+                text = text_cache.render(self.font_subtitle, line, True, YELLOW)
             elif line.startswith("Press"):
-                text = self.font_subtitle.render(line, True, GREEN)
+                text = text_cache.render(self.font_subtitle, line, True, GREEN)
             else:
-                text = self.font_instruction.render(line, True, WHITE)
+                text = text_cache.render(self.font_instruction, line, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             surface.blit(text, text_rect)
             y_offset += 30
@@ -185,13 +320,10 @@ class MenuScreen:
     def draw_orbit(self, surface, package):
         """Draw the pre-descent orbit screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(200)
-        surface.blit(overlay, (0, 0))
+        surface.blit(shades.get((SCREEN_WIDTH, SCREEN_HEIGHT), 200), (0, 0))
 
         # Header
-        header = self.font_title.render("INCOMING DELIVERY", True, YELLOW)
+        header = text_cache.render(self.font_title, "INCOMING DELIVERY", True, YELLOW)
         header_rect = header.get_rect(center=(SCREEN_WIDTH // 2, 100))
         surface.blit(header, header_rect)
 
@@ -199,12 +331,12 @@ class MenuScreen:
         if package:
             type_color = ORANGE if package.package_type == "fragile" else YELLOW
 
-            pkg_type = self.font_subtitle.render(
-                f"Type: {package.package_type.upper()}", True, type_color)
+            pkg_type = text_cache.render(
+                self.font_subtitle, f"Type: {package.package_type.upper()}", True, type_color)
             pkg_type_rect = pkg_type.get_rect(center=(SCREEN_WIDTH // 2, 180))
             surface.blit(pkg_type, pkg_type_rect)
 
-            pkg_name = self.font_subtitle.render(package.name, True, WHITE)
+            pkg_name = text_cache.render(self.font_subtitle, package.name, True, WHITE)
             pkg_name_rect = pkg_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
             surface.blit(pkg_name, pkg_name_rect)
 
@@ -213,12 +345,12 @@ class MenuScreen:
                 care_text = "Cares about: Smooth handling"
             else:
                 care_text = "Cares about: Speed"
-            care = self.font_instruction.render(care_text, True, GRAY)
+            care = text_cache.render(self.font_instruction, care_text, True, GRAY)
             care_rect = care.get_rect(center=(SCREEN_WIDTH // 2, 260))
             surface.blit(care, care_rect)
 
         # Start prompt
-        prompt = self.font_subtitle.render("Press SPACE to begin descent", True, GREEN)
+        prompt = text_cache.render(self.font_subtitle, "Press SPACE to begin descent", True, GREEN)
         prompt_rect = prompt.get_rect(center=(SCREEN_WIDTH // 2, 400))
         surface.blit(prompt, prompt_rect)
 
@@ -228,26 +360,47 @@ class RatingScreen:
 
     def __init__(self):
         """Initialize rating screen fonts."""
-        pygame.font.init()
-        self.font_title = pygame.font.Font(None, 48)
-        self.font_stars = pygame.font.Font(None, 72)
-        self.font_review = pygame.font.Font(None, 28)
-        self.font_instruction = pygame.font.Font(None, 24)
+        self.font_title = fonts.get(48)
+        self.font_stars = fonts.get(72)
+        self.font_review = fonts.get(28)
+        self.font_instruction = fonts.get(24)
+
+        # Composed overlay, reused until the package or outcome changes
+        self._overlay = None
+        self._overlay_package = None
+        self._overlay_landed = None
 
     def draw(self, surface, package, landed_successfully):
         """
         Draw the rating screen.
+        The overlay is composed once per delivery, then just blitted.
 
         Args:
             surface: Pygame surface
             package: The package that was delivered
             landed_successfully: Boolean indicating clean landing
         """
+        if (self._overlay is None
+                or self._overlay_package is not package
+                or self._overlay_landed != landed_successfully):
+            self._overlay = self._compose(package, landed_successfully)
+            self._overlay_package = package
+            self._overlay_landed = landed_successfully
+
+        # Overlay colors are premultiplied by alpha, which darkens the scene
+        # and adds the text exactly like drawing them directly would
+        surface.blit(self._overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def _compose(self, package, landed_successfully):
+        """
+        Draw the whole rating overlay onto a new transparent surface.
+
+        Returns:
+            Pygame surface with per-pixel alpha
+        """
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(220)
-        surface.blit(overlay, (0, 0))
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        surface.fill(BLACK + (220,))
 
         # Header
         if landed_successfully:
@@ -257,25 +410,25 @@ class RatingScreen:
             header_text = "DELIVERY FAILED"
             header_color = RED
 
-        header = self.font_title.render(header_text, True, header_color)
+        header = text_cache.render(self.font_title, header_text, True, header_color)
         header_rect = header.get_rect(center=(SCREEN_WIDTH // 2, 100))
         surface.blit(header, header_rect)
 
         if package:
             # Package name
-            name = self.font_review.render(f"Package: {package.name}", True, WHITE)
+            name = text_cache.render(self.font_review, f"Package: {package.name}", True, WHITE)
             name_rect = name.get_rect(center=(SCREEN_WIDTH // 2, 150))
             surface.blit(name, name_rect)
 
             # Star rating (using filled/empty star symbols)
             rating = package.calculate_rating()
             stars = "#" * rating + "-" * (5 - rating)
-            stars_text = self.font_stars.render(stars, True, YELLOW)
+            stars_text = text_cache.render(self.font_stars, stars, True, YELLOW)
             stars_rect = stars_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
             surface.blit(stars_text, stars_rect)
 
             # Numeric rating
-            rating_text = self.font_review.render(f"{rating}/5 Stars", True, GRAY)
+            rating_text = text_cache.render(self.font_review, f"{rating}/5 Stars", True, GRAY)
             rating_rect = rating_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
             surface.blit(rating_text, rating_rect)
 
@@ -284,26 +437,34 @@ class RatingScreen:
             self._draw_wrapped_text(surface, review, SCREEN_WIDTH // 2, 330, 600)
 
         # Continue prompt
-        prompt = self.font_instruction.render(
-            "Press SPACE for next delivery  |  ESC to quit", True, GREEN)
+        prompt = text_cache.render(
+            self.font_instruction, "Press SPACE for next delivery  |  ESC to quit", True, GREEN)
         prompt_rect = prompt.get_rect(center=(SCREEN_WIDTH // 2, 500))
         surface.blit(prompt, prompt_rect)
 
+        return surface
+
     def _draw_wrapped_text(self, surface, text, center_x, y, max_width):
         """Draw text wrapped to max_width, centered."""
         words = text.split(' ')
         lines = []
         current_line = []
+        current_width = 0
+
+        # Measure each word once instead of rendering every candidate line
+        space_width = self.font_review.size(' ')[0]
 
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = self.font_review.render(test_line, True, WHITE)
-            if test_surface.get_width() <= max_width:
+            word_width = self.font_review.size(word)[0]
+            test_width = current_width + space_width + word_width if current_line else word_width
+            if test_width <= max_width:
                 current_line.append(word)
+                current_width = test_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             lines.append(' '.join(current_line))
@@ -311,7 +472,7 @@ class RatingScreen:
         # Draw each line centered
         line_height = 30
         for i, line in enumerate(lines):
-            text_surface = self.font_review.render(line, True, WHITE)
+            text_surface = text_cache.render(self.font_review, line, True, WHITE)
             text_rect = text_surface.get_rect(center=(center_x, y + i * line_height))
             surface.blit(text_surface, text_rect)
 
@@ -320,28 +481,76 @@ class GameOverScreen:
     """Screen for when the player runs out of fuel."""
 
     def __init__(self):
-        pygame.font.init()
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_text = pygame.font.Font(None, 32)
+        self.font_title = fonts.get(64)
+        self.font_text = fonts.get(32)
 
     def draw(self, surface):
         """Draw game over screen."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
-        overlay.set_alpha(230)
-        surface.blit(overlay, (0, 0))
+        surface.blit(shades.get((SCREEN_WIDTH, SCREEN_HEIGHT), 230), (0, 0))
 
         # Title
-        title = self.font_title.render("OUT OF FUEL", True, RED)
+        title = text_cache.render(self.font_title, "OUT OF FUEL", True, RED)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
         surface.blit(title, title_rect)
 
         # Message
-        message = self.font_text.render("The package drifts forever into the void...", True, GRAY)
+        message = text_cache.render(
+            self.font_text, "The package drifts forever into the void...", True, GRAY)
         message_rect = message.get_rect(center=(SCREEN_WIDTH // 2, 280))
         surface.blit(message, message_rect)
 
         # Prompt
-        prompt = self.font_text.render("Press SPACE to try again  |  ESC to quit", True, WHITE)
+        prompt = text_cache.render(
+            self.font_text, "Press SPACE to try again  |  ESC to quit", True, WHITE)
         prompt_rect = prompt.get_rect(center=(SCREEN_WIDTH // 2, 400))
         surface.blit(prompt, prompt_rect)
+
+
+class ProfilerOverlay:
+    """Frame timing table drawn over the game while the profiler is on (F3)."""
+
+    REFRESH_FRAMES = 30  # Rebuild the table every half second, not every frame
+
+    def __init__(self):
+        self.font = fonts.get(20)
+        self._surface = None
+        self._frames_until_refresh = 0
+
+    def draw(self, surface, profiler):
+        """
+        Draw p50 / p95 / max times for the frame and each section.
+
+        Args:
+            surface: Pygame surface to draw on
+            profiler: profiler.FrameProfiler with recorded frames
+
+        Returns:
+            pygame.Rect of the area drawn
+        """
+        self._frames_until_refresh -= 1
+        if self._surface is None or self._frames_until_refresh <= 0:
+            self._surface = self._compose(profiler.stats())
+            self._frames_until_refresh = self.REFRESH_FRAMES
+        return surface.blit(self._surface, (10, 190))
+
+    def _compose(self, stats):
+        """Render the timing table onto a translucent panel."""
+        line_height = 18
+        rows = [("", "p50", "p95", "max")]
+        for name, p50, p95, worst in stats:
+            rows.append((name, f"{p50 * 1000:.2f}", f"{p95 * 1000:.2f}", f"{worst * 1000:.2f}"))
+
+        panel = pygame.Surface((300, 12 + line_height * (len(rows) + 1)), pygame.SRCALPHA)
+        panel.fill(BLACK + (180,))
+
+        # Values change every refresh, so they skip the shared text cache
+        title = self.font.render("FRAME TIMES (ms)  F3 hide  F4 save trace", True, YELLOW)
+        panel.blit(title, (6, 6))
+        for i, row in enumerate(rows):
+            y = 6 + line_height * (i + 1)
+            color = GRAY if i == 0 else (WHITE if row[0] == "frame" else GREEN)
+            panel.blit(self.font.render(row[0], True, color), (6, y))
+            for column, text in enumerate(row[1:]):
+                value = self.font.render(text, True, color)
+                panel.blit(value, (290 - 55 * (2 - column) - value.get_width(), y))
+        return panel
@@ -0,0 +1,192 @@
+import math
+import numpy as np
+import pygame
+
+# BallSystem stores every ball's data in NumPy arrays - one array per
+# property (all the x's together, all the y's together, ...) instead of
+# one dictionary per ball. That lets us move or bounce ALL the balls with
+# a single line of math instead of a Python loop over each ball.
+#
+# It still acts like a list of ball dictionaries, so older code like
+# update_ball(balls[0]) or "for ball in balls:" keeps working.
+
+
+class BallView:
+    """Looks like one ball dictionary, but reads and writes the arrays"""
+
+    def __init__(self, system, index):
+        self.system = system
+        self.index = index
+
+    def __getitem__(self, key):
+        if key == 'color':
+            return self.system.colors[self.system.color_index[self.index]]
+        if key == 'radius':
+            return int(self.system.radius[self.index])
+        return float(getattr(self.system, key)[self.index])
+
+    def __setitem__(self, key, value):
+        if key == 'color':
+            self.system.color_index[self.index] = self.system.get_color_index(value)
+        else:
+            getattr(self.system, key)[self.index] = value
+
+
+class BallSystem:
+    """Many balls stored as contiguous NumPy arrays"""
+
+    def __init__(self, colors):
+        # Colors are stored once here; each ball just keeps an index into this list
+        self.colors = list(colors)
+        self.count = 0
+        self._x = np.zeros(16)
+        self._y = np.zeros(16)
+        self._vx = np.zeros(16)
+        self._vy = np.zeros(16)
+        self._radius = np.zeros(16)
+        self._color_index = np.zeros(16, dtype=int)
+
+    # Each property is only the part of the array that holds real balls
+    # (these are views into the same memory, not copies)
+    @property
+    def x(self):
+        return self._x[:self.count]
+
+    @property
+    def y(self):
+        return self._y[:self.count]
+
+    @property
+    def vx(self):
+        return self._vx[:self.count]
+
+    @property
+    def vy(self):
+        return self._vy[:self.count]
+
+    @property
+    def radius(self):
+        return self._radius[:self.count]
+
+    @property
+    def color_index(self):
+        return self._color_index[:self.count]
+
+    def get_color_index(self, color):
+        """Returns the index of a color, adding it to the list if it's new"""
+        if color not in self.colors:
+            self.colors.append(color)
+        return self.colors.index(color)
+
+    def add(self, x, y, radius, color, vx, vy):
+        """Adds one ball and returns a view of it"""
+        # If the arrays are full, double their size
+        if self.count == len(self._x):
+            new_size = 2 * len(self._x)
+            self._x = np.resize(self._x, new_size)
+            self._y = np.resize(self._y, new_size)
+            self._vx = np.resize(self._vx, new_size)
+            self._vy = np.resize(self._vy, new_size)
+            self._radius = np.resize(self._radius, new_size)
+            self._color_index = np.resize(self._color_index, new_size)
+
+        i = self.count
+        self._x[i] = x
+        self._y[i] = y
+        self._vx[i] = vx
+        self._vy[i] = vy
+        self._radius[i] = radius
+        self._color_index[i] = self.get_color_index(color)
+        self.count += 1
+        return BallView(self, i)
+
+    def append(self, ball):
+        """Adds a ball dictionary (like the ones create_ball makes)"""
+        self.add(ball['x'], ball['y'], ball['radius'], ball['color'],
+                 ball['vx'], ball['vy'])
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return BallView(self, index)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield BallView(self, i)
+
+    def update(self):
+        """Moves every ball by its velocity (one operation for all balls)"""
+        self.x[:] += self.vx
+        self.y[:] += self.vy
+
+    def bounce(self, width, height, clamp=True):
+        """Reverses velocity for every ball touching a wall"""
+        x, y, radius = self.x, self.y, self.radius
+
+        # Which balls hit a wall? (arrays of True/False, one per ball)
+        hit_x = (x - radius <= 0) | (x + radius >= width)
+        hit_y = (y - radius <= 0) | (y + radius >= height)
+
+        # Flip velocity only where a wall was hit
+        np.negative(self.vx, out=self.vx, where=hit_x)
+        np.negative(self.vy, out=self.vy, where=hit_y)
+
+        # Push balls back inside the screen to prevent sticking
+        if clamp:
+            np.clip(x, radius, width - radius, out=x)
+            np.clip(y, radius, height - radius, out=y)
+
+    def overlapping(self, i, j):
+        """Given arrays of ball index pairs, returns True where the two balls touch"""
+        dx = self.x[i] - self.x[j]
+        dy = self.y[i] - self.y[j]
+        distance = np.sqrt(dx * dx + dy * dy)
+        return distance < self.radius[i] + self.radius[j]
+
+    def resolve_collisions(self, i, j):
+        """
+        Bounces apart touching pairs of balls, one pair after another,
+        with a simplified elastic collision (equal mass balls).
+        Plain Python lists are much faster than NumPy for one-at-a-time work.
+        """
+        x = self.x.tolist()
+        y = self.y.tolist()
+        vx = self.vx.tolist()
+        vy = self.vy.tolist()
+
+        for a, b in zip(i.tolist(), j.tolist()):
+            dx = x[b] - x[a]
+            dy = y[b] - y[a]
+            distance = math.sqrt(dx * dx + dy * dy)
+
+            # If statement: prevent division by zero
+            if distance == 0:
+                continue
+
+            # Normalize collision vector
+            nx = dx / distance
+            ny = dy / distance
+
+            # Relative velocity in collision normal direction
+            dot_product = (vx[a] - vx[b]) * nx + (vy[a] - vy[b]) * ny
+
+            # If statement: only resolve if balls are moving toward each other
+            if dot_product > 0:
+                vx[a] -= dot_product * nx
+                vy[a] -= dot_product * ny
+                vx[b] += dot_product * nx
+                vy[b] += dot_product * ny
+
+        # Copy the new velocities back into the arrays
+        self.vx[:] = vx
+        self.vy[:] = vy
+
+    def draw(self, screen):
+        """Draws every ball"""
+        xs = self.x.astype(int).tolist()
+        ys = self.y.astype(int).tolist()
+        radii = self.radius.astype(int).tolist()
+        color_indexes = self.color_index.tolist()
+        for x, y, radius, color_index in zip(xs, ys, radii, color_indexes):
+            pygame.draw.circle(screen, self.colors[color_index], (x, y), radius)
@@ -1,6 +1,7 @@
 import pygame
 import sys
 import random
+from ballsystem import BallSystem
 
 # Initialize pygame
 pygame.init()
@@ -64,8 +65,8 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Multiple Bouncing Balls - C++ Concepts Demo")
 clock = pygame.time.Clock()
 
-# Create list of balls (demonstrates list/array usage)
-balls = []
+# Create the ball storage (works like a list, but keeps the data in arrays)
+balls = BallSystem(COLORS)
 num_balls = 8
 
 # Loop to initialize multiple balls
@@ -83,7 +84,7 @@ for i in range(num_balls):
     if vy == 0:
         vy = 3
     
-    # Add ball to list (function call)
+    # Add ball to the system (function call)
     balls.append(create_ball(x, y, radius, color, vx, vy))
 
 # Main game loop (while loop)
@@ -94,17 +95,16 @@ while running:
         if event.type == pygame.QUIT:
             running = False
     
-    # Loop through each ball in the list
-    for ball in balls:
-        update_ball(ball)          # Function call
-        bounce_ball(ball, WIDTH, HEIGHT)  # Function call
+    # Move and bounce every ball at once
+    # (same as calling update_ball and bounce_ball on each ball)
+    balls.update()
+    balls.bounce(WIDTH, HEIGHT, clamp=False)
     
     # Drawing
     screen.fill(BLACK)
     
-    # Loop to draw all balls
-    for ball in balls:
-        draw_ball(screen, ball)    # Function call
+    # Draw all balls
+    balls.draw(screen)
     
     # Update display
     pygame.display.flip()
@@ -1,8 +1,12 @@
-import pygame
 import sys
 import random
 import math
 
+import numpy as np
+import pygame
+
+from ballsystem import BallSystem
+
 # Initialize pygame
 pygame.init()
 
@@ -36,52 +40,43 @@ def create_ball(x, y, radius, color, vx, vy):
         'vy': vy
     }
 
-# Function to calculate distance between two balls
-def get_distance(ball1, ball2):
-    """Returns the distance between two ball centers"""
-    dx = ball1['x'] - ball2['x']
-    dy = ball1['y'] - ball2['y']
-    return math.sqrt(dx * dx + dy * dy)
-
-# Function to check if two balls are colliding
-def check_ball_collision(ball1, ball2):
-    """Returns True if two balls are colliding"""
-    distance = get_distance(ball1, ball2)
-    # If statement: collision occurs when distance < sum of radii
-    if distance < ball1['radius'] + ball2['radius']:
-        return True
-    return False
-
-# Function to handle ball-to-ball collision
-def resolve_ball_collision(ball1, ball2):
-    """Updates velocities when two balls collide"""
-    # Calculate collision angle
-    dx = ball2['x'] - ball1['x']
-    dy = ball2['y'] - ball1['y']
-    distance = math.sqrt(dx * dx + dy * dy)
-    
-    # If statement: prevent division by zero
-    if distance == 0:
-        return
-    
-    # Normalize collision vector
-    nx = dx / distance
-    ny = dy / distance
-    
-    # Relative velocity
-    dvx = ball1['vx'] - ball2['vx']
-    dvy = ball1['vy'] - ball2['vy']
-    
-    # Relative velocity in collision normal direction
-    dot_product = dvx * nx + dvy * ny
-    
-    # If statement: only resolve if balls are moving toward each other
-    if dot_product > 0:
-        # Simple elastic collision (equal mass assumption)
-        ball1['vx'] -= dot_product * nx
-        ball1['vy'] -= dot_product * ny
-        ball2['vx'] += dot_product * nx
-        ball2['vy'] += dot_product * ny
+# Function to sort balls into grid cells (a "spatial hash")
+def build_spatial_hash(balls, cell_size):
+    """Returns a dictionary mapping (column, row) cells to lists of ball indexes"""
+    grid = {}
+    # Work out every ball's cell at once from the position arrays
+    columns = (balls.x // cell_size).astype(int).tolist()
+    rows = (balls.y // cell_size).astype(int).tolist()
+    for index in range(len(balls)):
+        cell = (columns[index], rows[index])
+        # If statement: start a new list the first time we see a cell
+        if cell not in grid:
+            grid[cell] = []
+        grid[cell].append(index)
+    return grid
+
+# Function to find pairs of balls that are close enough to maybe collide
+def get_candidate_pairs(grid):
+    """Returns (i, j) pairs of balls in the same or neighboring cells"""
+    pairs = []
+    for cell in grid:
+        col, row = cell
+        indexes = grid[cell]
+
+        # Pairs inside the same cell (each pair once)
+        for a in range(len(indexes)):
+            for b in range(a + 1, len(indexes)):
+                pairs.append((indexes[a], indexes[b]))
+
+        # Pairs with neighboring cells - only half of the 8 neighbors,
+        # because the other half will find us when it's their turn
+        for d_col, d_row in [(1, 0), (1, 1), (0, 1), (-1, 1)]:
+            neighbor = (col + d_col, row + d_row)
+            if neighbor in grid:
+                for i in indexes:
+                    for j in grid[neighbor]:
+                        pairs.append((i, j))
+    return pairs
 
 # Function to update ball position
 def update_ball(ball):
@@ -122,15 +117,25 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Multiple Bouncing Balls with Collisions")
 clock = pygame.time.Clock()
 
-# Create list of balls (demonstrates list/array usage)
-balls = []
+# Create the ball storage (works like a list, but keeps the data in arrays)
+balls = BallSystem(COLORS)
+
+# Number of balls - try "python bouncemulti.py 10000"
 num_balls = 8
+if len(sys.argv) > 1:
+    num_balls = int(sys.argv[1])
+if num_balls < 1:
+    sys.exit("Usage: python bouncemulti.py [number of balls, at least 1]")
+
+# Smaller balls when there are lots of them, so they still fit on screen
+max_radius = min(35, max(3, int(math.sqrt(WIDTH * HEIGHT / num_balls) / 3)))
+min_radius = max(2, max_radius * 20 // 35)
 
 # Loop to initialize multiple balls
 for i in range(num_balls):
     x = random.randint(50, WIDTH - 50)
     y = random.randint(50, HEIGHT - 50)
-    radius = random.randint(20, 35)
+    radius = random.randint(min_radius, max_radius)
     color = COLORS[i % len(COLORS)]  # Cycle through colors
     vx = random.randint(-4, 4)
     vy = random.randint(-4, 4)
@@ -141,9 +146,13 @@ for i in range(num_balls):
     if vy == 0:
         vy = 3
     
-    # Add ball to list (function call)
+    # Add ball to the system (function call)
     balls.append(create_ball(x, y, radius, color, vx, vy))
 
+# Grid cells as wide as the biggest ball, so two touching balls
+# are always in the same cell or next-door cells
+cell_size = 2 * balls.radius.max()
+
 # Main game loop (while loop)
 running = True
 while running:
@@ -152,24 +161,31 @@ while running:
         if event.type == pygame.QUIT:
             running = False
     
-    # Loop through each ball to update position
-    for ball in balls:
-        update_ball(ball)          # Function call
-        bounce_ball(ball, WIDTH, HEIGHT)  # Function call
+    # Move and bounce every ball at once
+    # (same as calling update_ball and bounce_ball on each ball)
+    balls.update()
+    balls.bounce(WIDTH, HEIGHT)
     
-    # Nested loop to check collisions between all pairs of balls
-    for i in range(len(balls)):
-        for j in range(i + 1, len(balls)):  # Only check each pair once
-            # If statement: check collision
-            if check_ball_collision(balls[i], balls[j]):
-                resolve_ball_collision(balls[i], balls[j])
+    # Only check pairs of balls that are near each other
+    # (checking every pair is far too slow with thousands of balls)
+    grid = build_spatial_hash(balls, cell_size)
+    pairs = get_candidate_pairs(grid)
+
+    # If statement: skip when no balls are close
+    if pairs:
+        # Check all candidate pairs at once
+        # (touching when the distance between centers < sum of radii)
+        first, second = np.array(pairs).T
+        touching = balls.overlapping(first, second)
+
+        # Bounce apart the pairs that really touch
+        balls.resolve_collisions(first[touching], second[touching])
     
     # Drawing
     screen.fill(BLACK)
     
-    # Loop to draw all balls
-    for ball in balls:
-        draw_ball(screen, ball)    # Function call
+    # Draw all balls
+    balls.draw(screen)
     
     # Update display
     pygame.display.flip()